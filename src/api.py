@@ -9,18 +9,29 @@ import logging
 import sys
 import os
 import asyncio
+import hashlib
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any
-from fastapi import FastAPI, HTTPException, Query, Depends, Request
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Query, Depends, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import Coder
+from fastapi_cache.decorator import cache
+from jinja2 import FileSystemBytecodeCache
+from redis import asyncio as aioredis
+import orjson
 from dotenv import load_dotenv
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
 from src.app.utils.logging_config import setup_logging
-from src.app.services.database import SupabaseClient
+from src.app.config import get_settings
+from src.app.services.database import DatabaseClient, get_supabase_client
 from src.app.services.crawler import TournamentCrawler
 from src.app.models.tournament import Tournament, TournamentResponse
 
@@ -35,21 +46,151 @@ logger = logging.getLogger(__name__)
 current_dir = os.path.dirname(os.path.abspath(__file__))
 base_dir = os.path.dirname(current_dir)  # Get the parent directory (the project root)
 
+def request_key_builder(func, namespace: str = "", *, request: Request = None, response=None, args=(), kwargs=None) -> str:
+    """
+    Build response cache keys from the request path and query string.
+
+    Keying on the request rather than the endpoint kwargs keeps injected
+    dependencies (database client, crawler) out of the key, so entries are
+    shared between workers using the same Redis backend.
+    """
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    return f"{namespace}:{func.__module__}:{func.__name__}:{request.url.path}?{query}"
+
+class ORJSONResponseCoder(Coder):
+    """
+    Response cache coder for endpoints that return pre-rendered JSON responses.
+
+    Stores the response body bytes as-is and replays them as a JSON response
+    on a cache hit, so cached pages skip re-serialization entirely.
+    """
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, Response):
+            return value.body
+        return orjson.dumps(value)
+
+    @classmethod
+    def decode(cls, value: bytes) -> Response:
+        return Response(content=value, media_type="application/json")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Set up shared resources for the lifetime of the application.
+
+    Initializes the response cache, backed by Redis when REDIS_URL is set and
+    by process memory otherwise, and builds the database client and crawler
+    once so requests reuse their connections. The frontend template is
+    compiled up front. When API_SCHEDULED_CRAWL is true, scheduled crawling
+    also runs as a background task.
+    """
+    settings = get_settings()
+    redis_url = settings.redis_url
+    if redis_url:
+        FastAPICache.init(RedisBackend(aioredis.from_url(redis_url)), prefix="chess-api", key_builder=request_key_builder)
+        logger.info("Response cache initialized with Redis backend")
+    else:
+        FastAPICache.init(InMemoryBackend(), prefix="chess-api", key_builder=request_key_builder)
+        logger.warning("REDIS_URL not set, using in-memory response cache")
+    
+    app.state.db = get_supabase_client()
+    app.state.crawler = TournamentCrawler()
+    # The response cache is initialized above, so saved crawls may clear it
+    app.state.crawler.clear_api_cache = True
+    
+    # Compile the frontend template before the first request
+    templates.env.get_template("index.html")
+    
+    # Optionally run the scheduled crawler on the API's event loop
+    crawl_task = None
+    if settings.api_scheduled_crawl:
+        logger.info("Starting scheduled crawling inside the API process")
+        crawl_task = asyncio.create_task(app.state.crawler.run_forever())
+    app.state.crawl_task = crawl_task
+    
+    yield
+    
+    if crawl_task is not None:
+        crawl_task.cancel()
+        try:
+            await crawl_task
+        except asyncio.CancelledError:
+            pass
+    
+    # Let background crawl history writes finish before shutting down
+    await app.state.crawler.flush_crawl_history()
+    await app.state.crawler.close()
+    await app.state.db.close()
+
 # Initialize FastAPI
 app = FastAPI(
     title="Chess Tournament API",
     description="API for accessing chess tournament data from Schachinter.net",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Browser/CDN cache lifetime in seconds for GET endpoints that send an ETag
+HTTP_CACHE_MAX_AGE = {
+    "/api/tournaments": 300,
+    "/api/enumerations": 3600,
+    "/api/months": 3600,
+    "/api/years": 3600,
+    "/api/categories": 3600,
+    "/api/tournament-types": 3600
+}
+
+@app.middleware("http")
+async def add_http_cache_headers(request: Request, call_next):
+    """
+    Add Cache-Control and a strong ETag to cacheable JSON responses.
+
+    The ETag is a hash of the response body, so it is identical across workers.
+    Requests whose If-None-Match matches it get an empty 304 response.
+    """
+    max_age = HTTP_CACHE_MAX_AGE.get(request.url.path)
+    if max_age is None or request.method != "GET":
+        return await call_next(request)
+    
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+    
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    
+    # Keep the raw header list so repeated headers such as Set-Cookie survive;
+    # setting through MutableHeaders replaces any existing etag case-insensitively
+    cached_response = Response(content=body, status_code=response.status_code)
+    cached_response.raw_headers = list(response.raw_headers)
+    for name, value in headers.items():
+        cached_response.headers[name] = value
+    return cached_response
+
 # Mount static files directory
 app.mount("/static", StaticFiles(directory=os.path.join(current_dir, "app/static")), name="static")
 
-# Set up templates
+# Set up templates; compiled once and kept as bytecode across restarts,
+# without re-checking the template files on every render
 templates = Jinja2Templates(directory=os.path.join(current_dir, "app/templates"))
+templates.env.auto_reload = False
+templates.env.bytecode_cache = FileSystemBytecodeCache()
 
-# Initialize database client
-db_client = SupabaseClient()
+def get_db_client(request: Request) -> DatabaseClient:
+    """Dependency returning the shared database client."""
+    return request.app.state.db
+
+def get_crawler(request: Request) -> TournamentCrawler:
+    """Dependency returning the shared tournament crawler."""
+    return request.app.state.crawler
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
@@ -61,7 +202,8 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "message": "API is up and running"}
 
-@app.get("/api/tournaments", response_model=TournamentResponse)
+@app.get("/api/tournaments", response_model=None, responses={200: {"model": TournamentResponse}})
+@cache(expire=300, coder=ORJSONResponseCoder)
 async def get_tournaments(
     month: Optional[str] = Query(None, description="Filter by month"),
     year: Optional[int] = Query(None, description="Filter by year"),
@@ -70,7 +212,8 @@ async def get_tournaments(
     category: Optional[str] = Query(None, description="Filter by category"),
     search: Optional[str] = Query(None, description="Search text in tournament name and description"),
     page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(12, ge=1, le=100, description="Number of items per page")
+    page_size: int = Query(12, ge=1, le=100, description="Number of items per page"),
+    db_client: DatabaseClient = Depends(get_db_client)
 ):
     """
     Get a list of tournaments with optional filtering and pagination.
@@ -113,8 +256,8 @@ async def get_tournaments(
         # Query database
         tournaments_result = await db_client.get_tournaments(filters, pagination)
         
-        # Return response
-        return {
+        # Return response, serialized directly since rows come straight from the database
+        return ORJSONResponse({
             "status": "success",
             "data": tournaments_result["data"],
             "meta": {
@@ -123,13 +266,13 @@ async def get_tournaments(
                 "page_size": page_size,
                 "pages": tournaments_result["pages"]
             }
-        }
+        })
     except Exception as e:
         logger.error(f"Error retrieving tournaments: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/crawl")
-async def trigger_crawl():
+async def trigger_crawl(crawler: TournamentCrawler = Depends(get_crawler)):
     """
     Manually trigger a crawl operation.
     
@@ -137,7 +280,6 @@ async def trigger_crawl():
         Summary of the crawl operation
     """
     try:
-        crawler = TournamentCrawler()
         tournaments = await crawler.crawl()
         
         return {
@@ -149,8 +291,52 @@ async def trigger_crawl():
         logger.error(f"Error during manual crawl: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def load_enumerations(db_client: DatabaseClient) -> Dict[str, List[Any]]:
+    """
+    Get every enumeration list, loading them from the database at most once per hour.
+
+    The lists are stored in the response cache backend under a single key, so
+    /api/enumerations and the per-field endpoints share one database round-trip
+    and are invalidated together with the other cached responses.
+
+    Args:
+        db_client: Database client used on a cache miss
+
+    Returns:
+        Dictionary with "months", "years", "categories" and "tournament_types" lists
+    """
+    backend = FastAPICache.get_backend()
+    key = f"{FastAPICache.get_prefix()}:enumerations"
+    
+    cached = await backend.get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+    
+    enumerations = await db_client.get_enumerations()
+    await backend.set(key, orjson.dumps(enumerations), expire=3600)
+    return enumerations
+
+@app.get("/api/enumerations")
+async def get_enumerations(db_client: DatabaseClient = Depends(get_db_client)):
+    """
+    Get all available months, years, categories and tournament types.
+    
+    Returns:
+        Dictionary of unique values for each field
+    """
+    try:
+        enumerations = await load_enumerations(db_client)
+        
+        return {
+            "status": "success",
+            "data": enumerations
+        }
+    except Exception as e:
+        logger.error(f"Error retrieving enumerations: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/months")
-async def get_available_months():
+async def get_available_months(db_client: DatabaseClient = Depends(get_db_client)):
     """
     Get a list of available months in the database.
     
@@ -158,8 +344,7 @@ async def get_available_months():
         List of unique months
     """
     try:
-        tournaments_data = await db_client.get_tournaments()
-        months = sorted(set(tournament["month"] for tournament in tournaments_data["data"] if "month" in tournament))
+        months = (await load_enumerations(db_client))["months"]
         
         return {
             "status": "success",
@@ -170,7 +355,7 @@ async def get_available_months():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/years")
-async def get_available_years():
+async def get_available_years(db_client: DatabaseClient = Depends(get_db_client)):
     """
     Get a list of available years in the database.
     
@@ -178,8 +363,7 @@ async def get_available_years():
         List of unique years
     """
     try:
-        tournaments_data = await db_client.get_tournaments()
-        years = sorted(set(tournament["year"] for tournament in tournaments_data["data"] if "year" in tournament))
+        years = (await load_enumerations(db_client))["years"]
         
         return {
             "status": "success",
@@ -190,7 +374,7 @@ async def get_available_years():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/categories")
-async def get_available_categories():
+async def get_available_categories(db_client: DatabaseClient = Depends(get_db_client)):
     """
     Get a list of available tournament categories.
     
@@ -198,7 +382,7 @@ async def get_available_categories():
         List of unique categories
     """
     try:
-        categories = await db_client.get_available_categories()
+        categories = (await load_enumerations(db_client))["categories"]
         
         return {
             "status": "success",
@@ -209,7 +393,7 @@ async def get_available_categories():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/tournament-types")
-async def get_available_tournament_types():
+async def get_available_tournament_types(db_client: DatabaseClient = Depends(get_db_client)):
     """
     Get a list of available tournament types.
     
@@ -217,7 +401,7 @@ async def get_available_tournament_types():
         List of unique tournament types
     """
     try:
-        types = await db_client.get_available_tournament_types()
+        types = (await load_enumerations(db_client))["tournament_types"]
         
         return {
             "status": "success",
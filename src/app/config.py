@@ -0,0 +1,77 @@
+"""
+Application settings loaded once from environment variables.
+"""
+import logging
+from functools import lru_cache
+from typing import Optional
+from dotenv import load_dotenv
+from pydantic import PositiveInt, ValidationError, ValidationInfo, ValidatorFunctionWrapHandler, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+class Settings(BaseSettings):
+    """
+    Typed view of the environment variables used by the application.
+    """
+    model_config = SettingsConfigDict(extra="ignore")
+
+    # Website to crawl and the User-Agent header sent with each request
+    target_url: str = "https://www.schachinter.net/"
+    user_agent: str = "Mozilla/5.0"
+
+    # Root log level name (DEBUG, INFO, ...)
+    log_level: str = "DEBUG"
+
+    # Crawl interval in hours
+    crawl_interval: PositiveInt = 24
+
+    # Anthropic API key for AI analysis
+    anthropic_api_key: Optional[str] = None
+
+    # Maximum number of concurrent Anthropic requests
+    llm_concurrency: PositiveInt = 8
+
+    # Number of tournaments analyzed per Anthropic request
+    llm_batch_size: PositiveInt = 20
+
+    # Redis connection URL for caching
+    redis_url: Optional[str] = None
+
+    # Run scheduled crawling inside the API process
+    api_scheduled_crawl: bool = False
+
+    # Use the in-memory mock database instead of Supabase
+    use_mock_db: bool = False
+
+    # Supabase configuration
+    supabase_url: Optional[str] = None
+    supabase_key: Optional[str] = None
+    supabase_service_role: Optional[str] = None
+    supabase_table_prefix: str = "ct_"
+
+    @field_validator("crawl_interval", "llm_concurrency", "llm_batch_size", "api_scheduled_crawl", "use_mock_db", mode="wrap")
+    @classmethod
+    def _default_on_invalid(cls, value, handler: ValidatorFunctionWrapHandler, info: ValidationInfo):
+        """
+        Fall back to the field default instead of failing on a malformed value.
+        """
+        try:
+            return handler(value)
+        except ValidationError:
+            default = cls.model_fields[info.field_name].default
+            logger.warning("Invalid %s value, defaulting to %s", info.field_name.upper(), default)
+            return default
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Get the application settings, parsing the environment only on first use.
+
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Tournament(BaseModel):
@@ -23,9 +23,9 @@ class Tournament(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Timestamp when this record was created")
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="Timestamp when this record was last updated")
 
-    class Config:
-        """Configuration for the Tournament model."""
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "name": "DSAM Chess Festival",
                 "month": "April",
@@ -38,6 +38,7 @@ class Tournament(BaseModel):
                 "website_url": "https://example.com/tournament"
             }
         }
+    )
 
 
 class PaginationMeta(BaseModel):
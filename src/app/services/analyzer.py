@@ -1,12 +1,17 @@
-import os
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
-import json
-from anthropic import Anthropic
+import orjson
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 import re
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from redis import asyncio as aioredis
 
+from ..config import get_settings
 from ..models.tournament import Tournament
 
 # Load environment variables
@@ -14,6 +19,120 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# How long cached analysis results are kept (30 days)
+ANALYSIS_CACHE_TTL = 30 * 86400
+
+# Output tokens budgeted per tournament in a batch response, and the model's output limit
+BATCH_TOKENS_PER_TOURNAMENT = 200
+MODEL_MAX_OUTPUT_TOKENS = 4096
+
+# Largest batch whose response fits in the model's output limit
+MAX_BATCH_SIZE = MODEL_MAX_OUTPUT_TOKENS // BATCH_TOKENS_PER_TOURNAMENT
+
+# Patterns for extracting JSON from model responses
+_JSON_BLOCK = re.compile(r'```json\n(.*?)\n```', re.DOTALL)
+_FENCE = re.compile(r'```.*?```', re.DOTALL)
+
+SYSTEM_PROMPT = "You analyze chess tournament information and return structured data as requested. Always respond with valid JSON."
+
+# Prompt for analyzing a single tournament
+PROMPT_TEMPLATE = """
+You are an expert in chess tournaments. You are tasked with analyzing information about a chess tournament to extract and infer detailed information.
+
+Here's what I know about the tournament:
+Name: {tournament_name}
+Month: {month}
+Year: {year}
+
+Please analyze this information and provide more details about the tournament.
+Infer the following:
+1. Whether the tournament is international or national
+2. The city where it takes place (if mentioned or can be inferred)
+3. The country (default to Germany unless clearly international)
+4. The type of tournament (Standard, Rapid, Blitz, etc.)
+5. The category (Open, Women, Senior, Youth, etc.)
+6. A brief description or any additional information that can be inferred
+
+Be precise and concise. If you can't infer something with reasonable confidence, don't guess.
+
+Return your analysis as valid JSON with the following schema:
+{{
+    "name": string,
+    "month": string,
+    "year": integer,
+    "is_international": boolean,
+    "city": string or null,
+    "country": string or null,
+    "tournament_type": string or null,
+    "category": string or null,
+    "description": string or null
+}}
+
+Respond with ONLY the JSON, no explanations or additional text.
+"""
+
+# Prompt for analyzing several tournaments at once
+BATCH_PROMPT_TEMPLATE = """
+You are an expert in chess tournaments. You are tasked with analyzing information about several chess tournaments to extract and infer detailed information.
+
+Here's what I know about the tournaments, one JSON object per line:
+{tournaments}
+
+Please analyze each tournament and provide more details about it.
+For every tournament, infer the following:
+1. Whether the tournament is international or national
+2. The city where it takes place (if mentioned or can be inferred)
+3. The country (default to Germany unless clearly international)
+4. The type of tournament (Standard, Rapid, Blitz, etc.)
+5. The category (Open, Women, Senior, Youth, etc.)
+6. A brief description or any additional information that can be inferred
+
+Be precise and concise. If you can't infer something with reasonable confidence, don't guess.
+
+Return your analysis as valid JSON with the following schema, with one entry per tournament
+and the "id" copied from the input:
+{{
+    "results": [
+        {{
+            "id": integer,
+            "name": string,
+            "month": string,
+            "year": integer,
+            "is_international": boolean,
+            "city": string or null,
+            "country": string or null,
+            "tournament_type": string or null,
+            "category": string or null,
+            "description": string or null
+        }}
+    ]
+}}
+
+Respond with ONLY the JSON, no explanations or additional text.
+"""
+
+@lru_cache(maxsize=1)
+def _anthropic_client(api_key: str) -> AsyncAnthropic:
+    """
+    Get the process-wide Anthropic client for an API key.
+    
+    Sharing one client keeps its HTTP/2 connection pool alive across analyzer
+    instances instead of opening new connections for every crawler.
+    
+    Args:
+        api_key: Anthropic API key
+        
+    Returns:
+        Shared AsyncAnthropic client
+    """
+    return AsyncAnthropic(
+        api_key=api_key,
+        http_client=DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32)
+        )
+    )
+
 class TournamentAnalysisResult(BaseModel):
     """Schema for tournament analysis result."""
     name: str = Field(..., description="Name of the tournament")
@@ -27,6 +146,13 @@ class TournamentAnalysisResult(BaseModel):
     description: Optional[str] = Field(None, description="Additional information or description")
 
 
+# Compiled validator for the results array of a batch analysis response
+_ANALYSIS_RESULT_LIST = TypeAdapter(List[TournamentAnalysisResult])
+
+# Tournament fields that take the analysis value only when they are still empty
+_FILL_IF_EMPTY_FIELDS = ('city', 'tournament_type', 'category')
+
+
 class TournamentAnalyzer:
     """
     Service class for analyzing tournament information using Anthropic.
@@ -36,54 +162,181 @@ class TournamentAnalyzer:
         """
         Initialize the analyzer with API key from environment variables.
         """
-        self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        settings = get_settings()
+        self.api_key = settings.anthropic_api_key
+        # Maximum number of concurrent Anthropic requests
+        self.concurrency = settings.llm_concurrency
+        # Number of tournaments analyzed per Anthropic request, capped so the
+        # JSON response is not truncated at the model's output limit
+        self.batch_size = min(settings.llm_batch_size, MAX_BATCH_SIZE)
+        if settings.llm_batch_size > MAX_BATCH_SIZE:
+            logger.warning(f"LLM_BATCH_SIZE {settings.llm_batch_size} exceeds {MAX_BATCH_SIZE}, using {MAX_BATCH_SIZE}")
+        
+        # Cache analysis results in Redis when available, otherwise in memory
+        self.cache = aioredis.from_url(settings.redis_url) if settings.redis_url else None
+        self._memory_cache: Dict[str, str] = {}
+        
         if not self.api_key:
             logger.warning("Anthropic API key not set. AI analysis will not be available.")
         else:
-            # Create Anthropic client with only the API key
+            # Reuse the shared Anthropic client and its connection pool
             try:
-                self.client = Anthropic(api_key=self.api_key)
+                self.client = _anthropic_client(self.api_key)
                 logger.info("Anthropic client initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize Anthropic client: {str(e)}")
                 logger.warning("AI analysis will not be available")
                 self.api_key = None
+    
+    def _cache_key(self, tournament: Tournament) -> str:
+        """
+        Build the analysis cache key for a tournament.
+        
+        Args:
+            tournament: Tournament object
             
-            # Setup the prompt template
-            self.prompt_template = """
-            You are an expert in chess tournaments. You are tasked with analyzing information about a chess tournament to extract and infer detailed information.
-            
-            Here's what I know about the tournament:
-            Name: {tournament_name}
-            Month: {month}
-            Year: {year}
-            
-            Please analyze this information and provide more details about the tournament.
-            Infer the following:
-            1. Whether the tournament is international or national
-            2. The city where it takes place (if mentioned or can be inferred)
-            3. The country (default to Germany unless clearly international)
-            4. The type of tournament (Standard, Rapid, Blitz, etc.)
-            5. The category (Open, Women, Senior, Youth, etc.)
-            6. A brief description or any additional information that can be inferred
-            
-            Be precise and concise. If you can't infer something with reasonable confidence, don't guess.
-            
-            Return your analysis as valid JSON with the following schema:
-            {{
-                "name": string,
-                "month": string,
-                "year": integer,
-                "is_international": boolean,
-                "city": string or null,
-                "country": string or null,
-                "tournament_type": string or null,
-                "category": string or null,
-                "description": string or null
-            }}
-            
-            Respond with ONLY the JSON, no explanations or additional text.
-            """
+        Returns:
+            Cache key derived from the tournament's name, month and year
+        """
+        identity = f"{tournament.name}|{tournament.month}|{tournament.year}"
+        return f"llm:{hashlib.blake2b(identity.encode()).hexdigest()}"
+    
+    async def _get_cached_analysis(self, tournament: Tournament) -> Optional[TournamentAnalysisResult]:
+        """
+        Look up a previously cached analysis result for a tournament.
+        
+        Args:
+            tournament: Tournament object
+            
+        Returns:
+            Cached TournamentAnalysisResult or None on a cache miss
+        """
+        key = self._cache_key(tournament)
+        try:
+            if self.cache is not None:
+                cached = await self.cache.get(key)
+            else:
+                cached = self._memory_cache.get(key)
+            
+            if cached:
+                return TournamentAnalysisResult.model_validate_json(cached)
+        except Exception as e:
+            logger.warning(f"Error reading analysis cache for {tournament.name}: {str(e)}")
+        return None
+    
+    async def get_cached_analyses(self, tournaments: List[Tournament]) -> List[Optional[TournamentAnalysisResult]]:
+        """
+        Look up cached analysis results for many tournaments in one cache round-trip.
+        
+        Args:
+            tournaments: List of Tournament objects
+            
+        Returns:
+            Cached TournamentAnalysisResult or None for each tournament, in input order
+        """
+        if not self.api_key or not tournaments:
+            return [None] * len(tournaments)
+        
+        keys = [self._cache_key(t) for t in tournaments]
+        try:
+            if self.cache is not None:
+                values = await self.cache.mget(keys)
+            else:
+                values = [self._memory_cache.get(key) for key in keys]
+        except Exception as e:
+            logger.warning(f"Error reading analysis cache: {str(e)}")
+            return [None] * len(tournaments)
+        
+        results = []
+        for tournament, value in zip(tournaments, values):
+            try:
+                results.append(TournamentAnalysisResult.model_validate_json(value) if value else None)
+            except ValidationError as e:
+                logger.warning(f"Ignoring invalid cached analysis for {tournament.name}: {str(e)}")
+                results.append(None)
+        return results
+    
+    async def _cache_analysis(self, tournament: Tournament, analysis_result: TournamentAnalysisResult):
+        """
+        Store an analysis result for a tournament.
+        
+        Args:
+            tournament: Tournament object the result belongs to
+            analysis_result: Parsed analysis for the tournament
+        """
+        key = self._cache_key(tournament)
+        try:
+            value = analysis_result.model_dump_json()
+            if self.cache is not None:
+                await self.cache.set(key, value, ex=ANALYSIS_CACHE_TTL)
+            else:
+                self._memory_cache[key] = value
+        except Exception as e:
+            logger.warning(f"Error writing analysis cache for {tournament.name}: {str(e)}")
+    
+    async def close(self):
+        """
+        Close the Redis connections of the analysis cache, if one is in use.
+        
+        The pool reconnects on its next use, so the analyzer can still be used
+        on a later event loop.
+        """
+        if self.cache is not None:
+            # redis 5 renamed close() to aclose()
+            aclose = getattr(self.cache, "aclose", None) or self.cache.close
+            await aclose()
+    
+    def _extract_json(self, response_text: str) -> str:
+        """
+        Extract the JSON payload from an Anthropic response.
+        
+        Args:
+            response_text: Raw text of the model response
+            
+        Returns:
+            JSON string with markdown code fences removed
+        """
+        # Extract the JSON part
+        json_match = _JSON_BLOCK.search(response_text)
+        if json_match:
+            json_str = json_match.group(1)
+        else:
+            # If no code block, try to extract JSON directly
+            json_str = response_text.strip()
+        
+        # Clean up any remaining markdown artifacts
+        return _FENCE.sub('', json_str)
+    
+    def _merge_analysis(self, tournament: Tournament, analysis_result: TournamentAnalysisResult) -> Tournament:
+        """
+        Merge an AI analysis result into a copy of the tournament.
+        
+        Args:
+            tournament: Original Tournament object
+            analysis_result: Parsed analysis for the tournament
+            
+        Returns:
+            Enhanced Tournament object
+        """
+        # Collect the fields to overwrite, then copy the tournament once
+        updates = {}
+        
+        # Only update fields if they were empty or if the AI is more confident
+        if not tournament.is_international:
+            updates['is_international'] = analysis_result.is_international
+        
+        for field in _FILL_IF_EMPTY_FIELDS:
+            value = getattr(analysis_result, field)
+            if value and not getattr(tournament, field):
+                updates[field] = value
+        
+        if analysis_result.country and tournament.country == "Germany" and analysis_result.is_international:
+            updates['country'] = analysis_result.country
+        
+        if analysis_result.description:
+            updates['description'] = analysis_result.description
+        
+        return tournament.model_copy(update=updates)
     
     async def analyze_tournament(self, tournament: Tournament) -> Optional[Tournament]:
         """
@@ -99,20 +352,25 @@ class TournamentAnalyzer:
             logger.warning("Skipping AI analysis - API key not configured")
             return tournament
         
+        cached_result = await self._get_cached_analysis(tournament)
+        if cached_result is not None:
+            logger.debug(f"Using cached AI analysis for: {tournament.name}")
+            return self._merge_analysis(tournament, cached_result)
+        
         try:
             # Prepare the prompt
-            prompt = self.prompt_template.format(
+            prompt = PROMPT_TEMPLATE.format(
                 tournament_name=tournament.name,
                 month=tournament.month,
                 year=tournament.year
             )
             
             # Get response from Anthropic
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model="claude-3-haiku-20240307",
                 max_tokens=1000,
                 temperature=0,
-                system="You analyze chess tournament information and return structured data as requested. Always respond with valid JSON.",
+                system=SYSTEM_PROMPT,
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
@@ -120,43 +378,12 @@ class TournamentAnalyzer:
             
             response_text = response.content[0].text
             
-            # Extract the JSON part
-            json_match = re.search(r'```json\n(.*?)\n```', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # If no code block, try to extract JSON directly
-                json_str = response_text.strip()
-            
-            # Clean up any remaining markdown artifacts
-            json_str = re.sub(r'```.*?```', '', json_str, flags=re.DOTALL)
-            
-            # Parse the result
+            # Parse and validate the result in a single pass, without an intermediate dict
             try:
-                result_dict = json.loads(json_str)
-                analysis_result = TournamentAnalysisResult(**result_dict)
-                
-                # Update the tournament with new information
-                enhanced_tournament = tournament.copy()
-                
-                # Only update fields if they were empty or if the AI is more confident
-                if not tournament.is_international:
-                    enhanced_tournament.is_international = analysis_result.is_international
-                
-                if not tournament.city and analysis_result.city:
-                    enhanced_tournament.city = analysis_result.city
-                
-                if analysis_result.country and tournament.country == "Germany" and analysis_result.is_international:
-                    enhanced_tournament.country = analysis_result.country
-                
-                if not tournament.tournament_type and analysis_result.tournament_type:
-                    enhanced_tournament.tournament_type = analysis_result.tournament_type
-                
-                if not tournament.category and analysis_result.category:
-                    enhanced_tournament.category = analysis_result.category
+                analysis_result = TournamentAnalysisResult.model_validate_json(self._extract_json(response_text))
+                await self._cache_analysis(tournament, analysis_result)
                 
-                if analysis_result.description:
-                    enhanced_tournament.description = analysis_result.description
+                enhanced_tournament = self._merge_analysis(tournament, analysis_result)
                 
                 logger.info(f"Successfully enhanced tournament information for: {tournament.name}")
                 return enhanced_tournament
@@ -170,10 +397,177 @@ class TournamentAnalyzer:
             logger.error(f"Error during AI analysis: {str(e)}")
             return tournament
     
+    async def analyze_tournament_batch(self, batch: List[Tournament]) -> List[Tournament]:
+        """
+        Analyze several tournaments with a single Anthropic request.
+        
+        Tournaments missing from the response, or whose result cannot be parsed,
+        are returned unchanged.
+        
+        Args:
+            batch: List of Tournament objects to analyze
+            
+        Returns:
+            List of enhanced Tournament objects, in the same order as the input
+        """
+        if not self.api_key:
+            logger.warning("Skipping AI analysis - API key not configured")
+            return batch
+        
+        try:
+            # Number the tournaments so results can be mapped back
+            tournament_lines = "\n".join(
+                orjson.dumps({"id": idx, "name": t.name, "month": t.month, "year": t.year}).decode()
+                for idx, t in enumerate(batch)
+            )
+            prompt = BATCH_PROMPT_TEMPLATE.format(tournaments=tournament_lines)
+            
+            # Get response from Anthropic
+            response = await self.client.messages.create(
+                model="claude-3-haiku-20240307",
+                max_tokens=min(BATCH_TOKENS_PER_TOURNAMENT * len(batch), MODEL_MAX_OUTPUT_TOKENS),
+                temperature=0,
+                system=SYSTEM_PROMPT,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+            
+            response_text = response.content[0].text
+            
+            try:
+                result_dict = orjson.loads(self._extract_json(response_text))
+                # Key results by integer id; the model may return ids as strings
+                results_by_id = {}
+                for item in result_dict.get("results", []):
+                    if not isinstance(item, dict):
+                        continue
+                    try:
+                        results_by_id[int(item["id"])] = item
+                    except (KeyError, TypeError, ValueError):
+                        logger.warning(f"Skipping AI batch result with invalid id: {item.get('id')!r}")
+            except Exception as e:
+                logger.error(f"Error parsing AI batch response: {str(e)}")
+                logger.debug(f"Problematic response: {response_text}")
+                return batch
+            
+            # Validate all returned results in a single pass, falling back to
+            # per-item validation so one malformed entry doesn't drop the batch
+            items = list(results_by_id.values())
+            try:
+                parsed_results = _ANALYSIS_RESULT_LIST.validate_python(items)
+            except ValidationError:
+                parsed_results = []
+                for item in items:
+                    try:
+                        parsed_results.append(TournamentAnalysisResult(**item))
+                    except ValidationError as e:
+                        logger.error(f"Error parsing AI analysis for result {item['id']}: {str(e)}")
+                        parsed_results.append(None)
+            analysis_results = dict(zip(results_by_id.keys(), parsed_results))
+            
+            enhanced_tournaments = []
+            for idx, tournament in enumerate(batch):
+                analysis_result = analysis_results.get(idx)
+                if analysis_result is None:
+                    logger.warning(f"No AI analysis returned for tournament: {tournament.name}")
+                    enhanced_tournaments.append(tournament)
+                    continue
+                
+                await self._cache_analysis(tournament, analysis_result)
+                enhanced_tournaments.append(self._merge_analysis(tournament, analysis_result))
+            
+            logger.info(f"Successfully enhanced batch of {len(batch)} tournaments")
+            return enhanced_tournaments
+            
+        except Exception as e:
+            logger.error(f"Error during AI batch analysis: {str(e)}")
+            return batch
+    
+    async def _iter_indexed_batches(
+        self,
+        tournaments: List[Tournament],
+        cached_results: Optional[List[Optional[TournamentAnalysisResult]]] = None
+    ) -> AsyncIterator[List[Tuple[int, Tournament]]]:
+        """
+        Analyze tournaments and yield (input index, enhanced tournament) pairs per completed batch.
+        
+        Cached results are yielded first as a single group; Anthropic batches
+        follow in completion order.
+        
+        Args:
+            tournaments: List of Tournament objects to analyze
+            cached_results: Results of get_cached_analyses(tournaments), if already fetched
+            
+        Yields:
+            Lists of (index into tournaments, enhanced Tournament) pairs
+        """
+        # Reuse cached results and only send cache misses to Anthropic
+        if cached_results is None:
+            cached_results = await self.get_cached_analyses(tournaments)
+        cached_pairs = []
+        uncached_indexes = []
+        for idx, (tournament, cached_result) in enumerate(zip(tournaments, cached_results)):
+            if cached_result is not None:
+                cached_pairs.append((idx, self._merge_analysis(tournament, cached_result)))
+            else:
+                uncached_indexes.append(idx)
+        logger.debug(f"Analysis cache hits: {len(cached_pairs)}, misses: {len(uncached_indexes)}")
+        
+        if cached_pairs:
+            yield cached_pairs
+        
+        batches = [
+            uncached_indexes[start:start + self.batch_size]
+            for start in range(0, len(uncached_indexes), self.batch_size)
+        ]
+        
+        # Run the batches concurrently, bounded to avoid provider rate limits
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def guarded_analyze(batch: List[int]) -> List[Tuple[int, Tournament]]:
+            async with semaphore:
+                enhanced = await self.analyze_tournament_batch([tournaments[idx] for idx in batch])
+                return list(zip(batch, enhanced))
+        
+        for next_batch in asyncio.as_completed([guarded_analyze(batch) for batch in batches]):
+            yield await next_batch
+    
+    async def iter_analyzed_batches(
+        self,
+        tournaments: List[Tournament],
+        cached_results: Optional[List[Optional[TournamentAnalysisResult]]] = None
+    ) -> AsyncIterator[List[Tournament]]:
+        """
+        Analyze tournaments, yielding each group of enhanced tournaments as soon as it is ready.
+        
+        Lets callers start consuming results (e.g. saving them) while later
+        batches are still being analyzed. Groups arrive in completion order.
+        
+        Args:
+            tournaments: List of Tournament objects to analyze
+            cached_results: Results of get_cached_analyses(tournaments), if the
+                caller already fetched them
+            
+        Yields:
+            Lists of enhanced Tournament objects
+        """
+        if not self.api_key:
+            logger.warning("Skipping AI analysis - API key not configured")
+            if tournaments:
+                yield tournaments
+            return
+        
+        async for pairs in self._iter_indexed_batches(tournaments, cached_results):
+            yield [tournament for _, tournament in pairs]
+    
     async def analyze_tournaments(self, tournaments: List[Tournament]) -> List[Tournament]:
         """
         Analyze a list of tournaments using AI and enhance their information.
         
+        Tournaments are sent to Anthropic in batches of LLM_BATCH_SIZE, with at
+        most LLM_CONCURRENCY batches in flight.
+        
         Args:
             tournaments: List of Tournament objects to analyze
             
@@ -184,11 +578,11 @@ class TournamentAnalyzer:
             logger.warning("Skipping AI analysis - API key not configured")
             return tournaments
         
-        enhanced_tournaments = []
+        enhanced_by_index: Dict[int, Tournament] = {}
+        async for pairs in self._iter_indexed_batches(tournaments):
+            enhanced_by_index.update(pairs)
         
-        for tournament in tournaments:
-            enhanced_tournament = await self.analyze_tournament(tournament)
-            enhanced_tournaments.append(enhanced_tournament)
+        enhanced_tournaments = [enhanced_by_index[idx] for idx in range(len(tournaments))]
         
         logger.info(f"Enhanced {len(enhanced_tournaments)} tournaments with AI analysis")
-        return enhanced_tournaments 
\ No newline at end of file
+        return enhanced_tournaments
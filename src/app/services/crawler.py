@@ -1,12 +1,12 @@
 import logging
-import os
-import schedule
-import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set
 import asyncio
+import aiohttp
 from dotenv import load_dotenv
+from fastapi_cache import FastAPICache
 
+from ..config import get_settings
 from ..models.tournament import Tournament
 from .scraper import SchachinterScraper
 from .analyzer import TournamentAnalyzer
@@ -30,12 +30,31 @@ class TournamentCrawler:
         self.analyzer = TournamentAnalyzer()
         self.db_client = get_database_client()
         
-        # Get crawl interval from environment variables (default to 24 hours)
-        try:
-            self.crawl_interval = int(os.getenv("CRAWL_INTERVAL", "24"))
-        except ValueError:
-            logger.warning("Invalid CRAWL_INTERVAL value, defaulting to 24 hours")
-            self.crawl_interval = 24
+        settings = get_settings()
+        
+        # Get crawl interval from settings (default to 24 hours)
+        self.crawl_interval = settings.crawl_interval
+        
+        # Crawl history writes still in flight; kept referenced until they finish
+        self._pending: Set[asyncio.Task] = set()
+        
+        # HTTP session shared by all crawls on the running event loop, created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Whether saved crawls clear the API response cache; set by the API
+        # once it has initialized the cache, left off for standalone runs
+        self.clear_api_cache = False
+        
+        logger.debug(
+            "Crawler configuration: USE_MOCK_DB=%s, SUPABASE_URL set=%s, SUPABASE_KEY set=%s, "
+            "SUPABASE_SERVICE_ROLE set=%s, SUPABASE_TABLE_PREFIX=%s, database client=%s",
+            settings.use_mock_db,
+            settings.supabase_url is not None,
+            settings.supabase_key is not None,
+            settings.supabase_service_role is not None,
+            settings.supabase_table_prefix,
+            self.db_client.__class__.__name__
+        )
     
     async def process_tournaments(self, tournaments: List[Tournament]) -> List[Tournament]:
         """
@@ -47,34 +66,121 @@ class TournamentCrawler:
         Returns:
             List of processed Tournament objects
         """
-        logger.debug(f"Starting to process {len(tournaments)} tournaments")
+        logger.debug("Starting to process %s tournaments", len(tournaments))
         
-        # Enhance tournaments with LLM analysis
-        enhanced_tournaments = await self.analyzer.analyze_tournaments(tournaments)
-        logger.debug(f"Enhanced {len(enhanced_tournaments)} tournaments with AI analysis")
+        # Look up which tournaments already exist before spending LLM calls on them,
+        # overlapping the database query with the analysis cache lookup
+        keys = [(tournament.name, tournament.month, tournament.year) for tournament in tournaments]
+        existing_keys, cached_results = await asyncio.gather(
+            self.db_client.get_existing_keys(keys),
+            self.analyzer.get_cached_analyses(tournaments)
+        )
         
-        # Save to database
-        saved_tournaments = []
-        for tournament in enhanced_tournaments:
-            logger.debug(f"Processing tournament: {tournament.name}")
-            # Check if tournament already exists
-            exists = await self.db_client.check_tournament_exists(
-                tournament.name, tournament.month, tournament.year
-            )
-            
-            if not exists:
-                # Insert new tournament
-                result = await self.db_client.insert_tournament(tournament)
-                logger.info(f"Saved new tournament: {tournament.name}")
-                logger.debug(f"Insertion result: {result is not None}")
+        new_tournaments = []
+        new_cached_results = []
+        exists_flags = []
+        # Check the log level once rather than formatting a message per existing tournament
+        log_existing = logger.isEnabledFor(logging.INFO)
+        for tournament, key, cached_result in zip(tournaments, keys, cached_results):
+            exists = key in existing_keys
+            exists_flags.append(exists)
+            if exists:
+                if log_existing:
+                    logger.info("Tournament already exists: %s", key[0])
             else:
-                logger.info(f"Tournament already exists: {tournament.name}")
-            
-            saved_tournaments.append(tournament)
+                # Also treat repeats within this scrape as existing
+                existing_keys.add(key)
+                new_tournaments.append(tournament)
+                new_cached_results.append(cached_result)
+        logger.debug("%s of %s tournaments are new", len(new_tournaments), len(tournaments))
+        
+        # Enhance only the new tournaments with LLM analysis, saving each
+        # batch as soon as it is ready while later batches are still analyzed
+        persist_tasks = []
+        async for enhanced_batch in self.analyzer.iter_analyzed_batches(new_tournaments, new_cached_results):
+            persist_tasks.append(asyncio.create_task(self._persist(enhanced_batch)))
+        persisted_batches = await asyncio.gather(*persist_tasks)
+        
+        enhanced_by_key = {
+            (tournament.name, tournament.month, tournament.year): tournament
+            for batch in persisted_batches for tournament in batch
+        }
+        logger.debug("Enhanced and saved %s new tournaments", len(enhanced_by_key))
+        
+        # Keep the scraped order, substituting the enhanced version of each new tournament
+        saved_tournaments = [
+            tournament if exists else enhanced_by_key[key]
+            for tournament, key, exists in zip(tournaments, keys, exists_flags)
+        ]
+        
+        logger.debug("Completed processing tournaments. Saved count: %s", len(saved_tournaments))
+        
+        # New data may have landed, so drop cached API responses
+        await self._invalidate_api_cache()
         
-        logger.debug(f"Completed processing tournaments. Saved count: {len(saved_tournaments)}")
         return saved_tournaments
     
+    async def _persist(self, tournaments: List[Tournament]) -> List[Tournament]:
+        """
+        Save a batch of new, already-analyzed tournaments with a single upsert.
+        
+        Args:
+            tournaments: List of Tournament objects that do not exist yet
+            
+        Returns:
+            The same list of Tournament objects
+        """
+        inserted = await self.db_client.upsert_tournaments(tournaments)
+        logger.info("Saved %s new tournaments", inserted)
+        
+        return tournaments
+    
+    async def _invalidate_api_cache(self):
+        """
+        Clear cached API responses after new tournament data has been saved.
+        
+        Does nothing unless clear_api_cache is set, e.g. when the crawler runs
+        standalone from main.py; cached entries then expire through their TTL.
+        """
+        if not self.clear_api_cache:
+            logger.debug("Response cache not in use, skipping invalidation")
+            return
+        
+        try:
+            await FastAPICache.clear()
+            logger.info("Cleared cached API responses")
+        except Exception as e:
+            logger.warning("Failed to clear cached API responses: %s", e)
+    
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Create the shared HTTP session on first use and hand it to the scraper.
+        
+        The session is created lazily because aiohttp binds it to the running
+        event loop. Its connector keeps connections alive and caches DNS
+        lookups, so later crawls skip the TCP/TLS handshakes and resolution.
+        
+        Returns:
+            The shared aiohttp session
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=100, keepalive_timeout=30, ttl_dns_cache=300, use_dns_cache=True)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self.scraper.session = self._session
+        return self._session
+    
+    async def close(self):
+        """
+        Close the shared HTTP session, any session the scraper opened itself,
+        and the analyzer's Redis connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self.scraper.session = None
+        await self.scraper.close()
+        await self.analyzer.close()
+    
     async def crawl(self) -> List[Tournament]:
         """
         Perform a single crawl operation: scrape, analyze, and save tournaments.
@@ -84,65 +190,134 @@ class TournamentCrawler:
         """
         logger.info("Starting crawl operation")
         
-        # Debug environment variables
-        logger.info(f"USE_MOCK_DB = {os.getenv('USE_MOCK_DB')}")
-        logger.info(f"SUPABASE_URL = {os.getenv('SUPABASE_URL') is not None}")
-        logger.info(f"SUPABASE_KEY = {os.getenv('SUPABASE_KEY') is not None}")
-        logger.info(f"SUPABASE_SERVICE_ROLE = {os.getenv('SUPABASE_SERVICE_ROLE') is not None}")
-        logger.info(f"SUPABASE_TABLE_PREFIX = {os.getenv('SUPABASE_TABLE_PREFIX')}")
-        logger.info(f"Database client class: {self.db_client.__class__.__name__}")
-        
         try:
+            await self._ensure_session()
+            
             # Step 1: Scrape tournaments
             tournaments = await self.scraper.scrape()
             if not tournaments:
                 logger.warning("No tournaments found during scraping")
                 # Record empty crawl history
-                await self.db_client.record_crawl_history(0, "success")
+                self._record_history(0, "success")
                 return []
             
-            logger.info(f"Scraped {len(tournaments)} tournaments")
+            logger.info("Scraped %s tournaments", len(tournaments))
             
             # Step 2: Process tournaments
             processed_tournaments = await self.process_tournaments(tournaments)
             
             # Record successful crawl history
-            await self.db_client.record_crawl_history(len(processed_tournaments), "success")
+            self._record_history(len(processed_tournaments), "success")
             
-            logger.info(f"Crawl operation completed, processed {len(processed_tournaments)} tournaments")
+            logger.info("Crawl operation completed, processed %s tournaments", len(processed_tournaments))
             return processed_tournaments
         except Exception as e:
-            logger.error(f"Crawl operation failed: {str(e)}")
+            logger.error("Crawl operation failed: %s", e)
             # Record failed crawl history
-            await self.db_client.record_crawl_history(0, "failed", str(e))
+            self._record_history(0, "failed", str(e))
             raise
     
-    def start_scheduled_crawling(self):
+    def _record_history(self, tournaments_count: int, status: str, error: Optional[str] = None):
         """
-        Start scheduled crawling at the specified interval.
+        Record a crawl in the background so the crawl result is not held up by the write.
+        
+        Args:
+            tournaments_count: Number of tournaments processed
+            status: Status of the crawl operation (success/failed)
+            error: Error message if the crawl failed
+        """
+        task = asyncio.create_task(self._safe_record_history(tournaments_count, status, error))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+    
+    async def _safe_record_history(self, tournaments_count: int, status: str, error: Optional[str] = None):
         """
-        logger.info(f"Starting scheduled crawling every {self.crawl_interval} hours")
+        Record a crawl, logging instead of raising on failure.
         
-        # Define the job to run
-        def job():
-            logger.info(f"Running scheduled crawl at {datetime.now()}")
-            asyncio.run(self.crawl())
+        Args:
+            tournaments_count: Number of tournaments processed
+            status: Status of the crawl operation (success/failed)
+            error: Error message if the crawl failed
+        """
+        try:
+            await self.db_client.record_crawl_history(tournaments_count, status, error)
+        except Exception as e:
+            logger.error("Failed to record crawl history: %s", e)
+    
+    async def flush_crawl_history(self):
+        """
+        Wait for all background crawl history writes to finish.
+        """
+        if self._pending:
+            await asyncio.gather(*self._pending)
+    
+    async def _crawl_once(self) -> List[Tournament]:
+        """
+        Crawl once, wait for the crawl history to be written and close the HTTP session.
         
-        # Schedule the job
-        schedule.every(self.crawl_interval).hours.do(job)
+        Returns:
+            List of processed Tournament objects
+        """
+        try:
+            return await self.crawl()
+        finally:
+            await self.flush_crawl_history()
+            await self.close()
+    
+    async def run_forever(self):
+        """
+        Crawl immediately, then again every crawl interval, on the running event loop.
         
-        # Run immediately on startup
-        logger.info("Running initial crawl on startup")
-        asyncio.run(self.crawl())
+        Keeping a single long-lived loop lets HTTP connection pools and caches
+        survive between crawls. Failed crawls are logged and recorded by crawl()
+        and do not stop the loop. Runs are scheduled at fixed times from the
+        start, so the time a crawl takes does not push later runs back.
+        """
+        loop = asyncio.get_running_loop()
+        interval = self.crawl_interval * 3600
+        next_run = loop.time()
+        try:
+            while True:
+                logger.info("Running scheduled crawl at %s", datetime.now())
+                try:
+                    await self.crawl()
+                except Exception as e:
+                    logger.error("Scheduled crawl failed: %s", e)
+                
+                # Skip runs that were missed while a crawl overran the interval
+                next_run += interval
+                now = loop.time()
+                if next_run < now:
+                    next_run += ((now - next_run) // interval + 1) * interval
+                await asyncio.sleep(next_run - now)
+        finally:
+            await self.close()
+    
+    async def _run_standalone(self, coro):
+        """
+        Run a crawl coroutine as the whole program, closing the database connections when it ends.
         
-        # Keep the scheduler running
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Sleep for 1 minute between checks
+        Args:
+            coro: Coroutine to run, such as run_forever()
+            
+        Returns:
+            The coroutine's result
+        """
+        try:
+            return await coro
+        finally:
+            await self.db_client.close()
+    
+    def start_scheduled_crawling(self):
+        """
+        Start scheduled crawling at the specified interval.
+        """
+        logger.info("Starting scheduled crawling every %s hours", self.crawl_interval)
+        asyncio.run(self._run_standalone(self.run_forever()))
     
     def run_once(self):
         """
         Run the crawler once without scheduling.
         """
         logger.info("Running single crawl operation")
-        asyncio.run(self.crawl()) 
\ No newline at end of file
+        asyncio.run(self._run_standalone(self._crawl_once())) 
\ No newline at end of file
@@ -1,43 +1,440 @@
-import os
 import logging
-from dotenv import load_dotenv
-from typing import List, Dict, Any, Optional
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import AsyncIterator, List, Dict, Any, Callable, Optional, Set, Tuple
 from datetime import datetime
-import json
 import uuid
-from supabase import create_client, Client
+import httpx
+import orjson
+from pydantic import TypeAdapter
+from postgrest import base_request_builder
+from postgrest.exceptions import APIError
+from supabase import AsyncClient, AsyncClientOptions
 
+from ..config import get_settings
 from ..models.tournament import Tournament
 
-# Load environment variables
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
-class MockDatabaseClient:
+# Maximum number of tournament names per existence lookup query
+EXISTING_KEYS_CHUNK_SIZE = 100
+
+# Maximum number of rows per bulk insert request, to stay under PostgREST payload limits
+INSERT_CHUNK_SIZE = 500
+
+# Number of rows fetched per request when iterating over every tournament
+TOURNAMENT_PAGE_SIZE = 500
+
+# Connection pool for Supabase requests, sized for bursts of concurrent queries; idle connections are kept for 30 seconds
+SUPABASE_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+# Fail fast on connect, but leave room for bulk upserts that refresh the enumerations view
+SUPABASE_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=2.0)
+
+# Seconds to reuse the category and tournament type lists before reading them again
+LOOKUP_CACHE_TTL = 300
+
+# Calendar position of each month name, matching the order used by the distinct views
+MONTH_ORDER = {
+    month: index for index, month in enumerate([
+        "January", "February", "March", "April", "May", "June", "July",
+        "August", "September", "October", "November", "December"
+    ])
+}
+
+def _serialize(tournament: Tournament) -> Dict[str, Any]:
     """
-    Mock database client for testing purposes.
-    Uses in-memory storage to simulate a database.
+    Convert a tournament to a row dictionary for Supabase.
+    
+    Datetimes are kept as datetime objects for orjson to encode on the wire,
+    and None values are omitted, so Supabase generates ids and applies
+    column defaults.
+    
+    Args:
+        tournament: Tournament model instance
+        
+    Returns:
+        Dictionary ready to be sent to the database
+    """
+    return tournament.model_dump(exclude_none=True)
+
+# Serializer for whole batches of tournaments, built once at import time
+_TOURNAMENT_LIST = TypeAdapter(List[Tournament])
+
+def _serialize_many(tournaments: List[Tournament]) -> List[Dict[str, Any]]:
+    """
+    Convert a batch of tournaments to row dictionaries in a single serializer call.
+    
+    Args:
+        tournaments: List of Tournament model instances
+        
+    Returns:
+        List of dictionaries in the same format as _serialize()
+    """
+    return _TOURNAMENT_LIST.dump_python(tournaments, exclude_none=True)
+
+def _first(response) -> Optional[Dict[str, Any]]:
+    """
+    Get the first row of a Supabase response.
+    
+    Args:
+        response: PostgREST API response
+        
+    Returns:
+        The first row, or None if the response has no rows
+    """
+    return response.data[0] if response.data else None
+
+class _OrjsonHttpClient(httpx.AsyncClient):
+    """
+    HTTP client for Supabase that encodes JSON request bodies with orjson.
+    
+    orjson is faster than the standard library encoder httpx uses and
+    serializes datetime and UUID values natively.
+    """
+    
+    def build_request(self, method, url, *, json: Any = None, **kwargs) -> httpx.Request:
+        if json is not None:
+            kwargs['content'] = orjson.dumps(json)
+            headers = httpx.Headers(kwargs.get('headers'))
+            headers.setdefault('Content-Type', 'application/json')
+            kwargs['headers'] = headers
+        return super().build_request(method, url, **kwargs)
+
+class _OrjsonJSONAdapter:
+    """
+    Drop-in for postgrest's JSON TypeAdapter that parses response bodies with orjson.
+    
+    postgrest validates every value of a response against its recursive JSON
+    type, which is an order of magnitude slower than orjson for large
+    listings. Bodies orjson rejects (such as the empty body of a
+    returning='minimal' request) are handed to the original adapter, so
+    postgrest's fallback handling is unchanged.
+    """
+    
+    def __init__(self, adapter: TypeAdapter):
+        self._adapter = adapter
+    
+    def validate_json(self, data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return self._adapter.validate_json(data)
+
+# Parse Supabase responses with orjson as well
+base_request_builder.JSONAdapter = _OrjsonJSONAdapter(base_request_builder.JSONAdapter)
+
+class DatabaseClient(ABC):
+    """
+    Interface shared by the Supabase and in-memory database clients.
+    
+    Use get_supabase_client() or get_mock_client() to share one connection
+    (or one in-memory store) across a process; instantiating a client class
+    directly creates a separate one.
+    """
+    
+    def __init__(self):
+        """
+        Initialize the client's connection or storage.
+        """
+        self._initialize()
+    
+    @abstractmethod
+    def _initialize(self):
+        """
+        Set up the client's connection or storage.
+        """
+    
+    @abstractmethod
+    async def insert_tournament(self, tournament: Tournament) -> Dict[str, Any]:
+        """
+        Insert a tournament, skipping it if (name, month, year) already exists.
+        """
+    
+    @abstractmethod
+    async def upsert_tournaments(self, tournaments: List[Tournament]) -> int:
+        """
+        Insert tournaments in bulk, skipping ones that already exist; returns the number inserted.
+        """
+    
+    @abstractmethod
+    async def get_tournaments(self, filters: Optional[Dict[str, Any]] = None, pagination: Optional[Dict[str, int]] = None, columns: str = '*') -> Dict[str, Any]:
+        """
+        Retrieve tournaments with optional filtering, pagination and column projection.
+        """
+    
+    @abstractmethod
+    async def update_tournament(self, tournament_id: str, data: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Update a tournament's fields, stamping updated_at with now (default: the current time).
+        """
+    
+    @abstractmethod
+    async def delete_tournament(self, tournament_id: str) -> Dict[str, Any]:
+        """
+        Delete a tournament and return its data.
+        """
+    
+    @abstractmethod
+    async def check_tournament_exists(self, name: str, month: str, year: int) -> bool:
+        """
+        Check if a tournament with the same name, month, and year exists.
+        """
+    
+    @abstractmethod
+    async def get_existing_keys(self, keys: List[Tuple[str, str, int]]) -> Set[Tuple[str, str, int]]:
+        """
+        Find which (name, month, year) keys already exist.
+        """
+    
+    @abstractmethod
+    async def get_available_categories(self) -> List[str]:
+        """
+        Retrieve all unique tournament categories.
+        """
+    
+    @abstractmethod
+    async def get_available_tournament_types(self) -> List[str]:
+        """
+        Retrieve all unique tournament types.
+        """
+    
+    @abstractmethod
+    async def get_distinct(self, column: str) -> List[Any]:
+        """
+        Retrieve the ordered unique values of a tournament column.
+        """
+    
+    @abstractmethod
+    async def get_enumerations(self) -> Dict[str, List[Any]]:
+        """
+        Retrieve the distinct months, years, categories and tournament types.
+        """
+    
+    @abstractmethod
+    async def record_crawl_history(self, tournaments_count: int, status: str = "success", error: str = None) -> Dict[str, Any]:
+        """
+        Record a crawl operation in the crawl history.
+        """
+    
+    async def iter_tournaments(self, columns: str = '*', page_size: int = TOURNAMENT_PAGE_SIZE) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every tournament, fetching one page of rows at a time.
+        
+        Args:
+            columns: Comma-separated list of columns to return, or '*' for all
+            page_size: Number of rows to fetch per page
+            
+        Yields:
+            Tournament rows as dictionaries
+        """
+        page = 1
+        while True:
+            result = await self.get_tournaments(pagination={'page': page, 'page_size': page_size}, columns=columns)
+            for row in result["data"]:
+                yield row
+            if page >= result["pages"]:
+                return
+            page += 1
+    
+    async def close(self):
+        """
+        Release the client's connections. The client must not be used afterwards.
+        """
+    
+    @staticmethod
+    def _stamp_updated_at(data: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Copy update data with the updated_at field set, leaving the caller's dictionary untouched.
+        
+        Args:
+            data: Dictionary of fields to update
+            now: Timestamp to store; defaults to the current time
+            
+        Returns:
+            New dictionary with updated_at added
+        """
+        return {**data, 'updated_at': now or datetime.utcnow()}
+
+# Text columns matched by the mock client's search filter
+SEARCH_FIELDS = ('name', 'description', 'city')
+
+# Columns the mock client indexes by value, for equality filters and distinct lookups
+INDEXED_FIELDS = ('month', 'year', 'category', 'tournament_type', 'city')
+
+def _trigrams(text: str) -> Set[str]:
+    """
+    Split text into its overlapping three-character substrings.
+    
+    Args:
+        text: Lowercased text
+        
+    Returns:
+        Set of trigrams; empty for text shorter than three characters
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class TournamentRow:
+    """
+    Compact in-memory tournament row used by MockDatabaseClient.
+    
+    Stores fields in __slots__ instead of a per-row dict. Every field is set on
+    creation, so fields can be read as plain attributes. Unset (None) fields
+    behave as missing keys, matching the dictionaries produced by _serialize().
+    search_text holds the lowercased search fields and is maintained by
+    MockDatabaseClient; it is not part of the row data.
     """
-    _instance = None
+    FIELDS = tuple(Tournament.model_fields)
+    __slots__ = FIELDS + ('search_text',)
+    
+    def __init__(self, data: Dict[str, Any]):
+        for field in self.FIELDS:
+            setattr(self, field, data.get(field))
+        self.search_text: Tuple[str, ...] = ()
+    
+    def __contains__(self, field: str) -> bool:
+        return getattr(self, field, None) is not None
+    
+    def __getitem__(self, field: str) -> Any:
+        return getattr(self, field)
     
-    def __new__(cls):
+    def get(self, field: str, default: Any = None) -> Any:
+        value = getattr(self, field, None)
+        return default if value is None else value
+    
+    def update(self, data: Dict[str, Any]):
+        for field, value in data.items():
+            setattr(self, field, value)
+    
+    def to_dict(self) -> Dict[str, Any]:
         """
-        Implements the Singleton pattern to ensure only one database connection.
+        Convert the row to a dictionary, omitting unset fields.
         """
-        if cls._instance is None:
-            cls._instance = super(MockDatabaseClient, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
+        return {field: getattr(self, field) for field in self.FIELDS if getattr(self, field) is not None}
+
+class MockDatabaseClient(DatabaseClient):
+    """
+    Mock database client for testing purposes.
+    Uses in-memory storage to simulate a database.
+    """
     
     def _initialize(self):
         """
         Initialize the mock database.
         """
-        self.tournaments = []
+        # Tournament rows by id, in insertion order, plus an index of ids by (name, month, year)
+        self._by_id: Dict[str, TournamentRow] = {}
+        self._by_key: Dict[Tuple[str, str, int], str] = {}
+        # Ids of the rows holding each value of the indexed columns, kept up to date on every write
+        self._field_index: Dict[str, Dict[Any, Set[str]]] = {field: {} for field in INDEXED_FIELDS}
+        # Ids of the rows whose search fields contain each trigram, to narrow down text searches
+        self._trigram_index: Dict[str, Set[str]] = {}
+        # Insertion position of each row, to return index lookups in insertion order
+        self._position: Dict[str, int] = {}
+        self._next_position = 0
         self.crawl_history = []
         logger.info("Mock database client initialized successfully")
     
+    @property
+    def tournaments(self) -> List[Dict[str, Any]]:
+        """
+        All stored tournaments as dictionaries, in insertion order.
+        """
+        return [row.to_dict() for row in self._by_id.values()]
+    
+    @staticmethod
+    def _key(tournament: TournamentRow) -> Tuple[str, str, int]:
+        """
+        Build the (name, month, year) key of a stored tournament.
+        """
+        return (tournament.name, tournament.month, tournament.year)
+    
+    @staticmethod
+    def _search_trigrams(tournament: TournamentRow) -> Set[str]:
+        """
+        Collect the trigrams of a stored tournament's lowercased search fields.
+        """
+        trigrams = set()
+        for text in tournament.search_text:
+            trigrams |= _trigrams(text)
+        return trigrams
+    
+    def _index(self, tournament: TournamentRow):
+        """
+        Add a stored tournament to the key, field value and search indexes.
+        
+        Also lowercases the tournament's search fields once, so searches only
+        run substring checks on the stored text.
+        """
+        tournament.search_text = tuple(
+            value.lower() for value in (getattr(tournament, field) for field in SEARCH_FIELDS) if value
+        )
+        self._by_key[self._key(tournament)] = tournament.id
+        for field, index in self._field_index.items():
+            value = getattr(tournament, field)
+            if value is not None:
+                index.setdefault(value, set()).add(tournament.id)
+        for trigram in self._search_trigrams(tournament):
+            self._trigram_index.setdefault(trigram, set()).add(tournament.id)
+    
+    def _unindex(self, tournament: TournamentRow):
+        """
+        Remove a stored tournament from the key, field value and search indexes.
+        """
+        # Only drop the key entry if it still points at this tournament
+        key = self._key(tournament)
+        if self._by_key.get(key) == tournament.id:
+            del self._by_key[key]
+        for field, index in self._field_index.items():
+            value = getattr(tournament, field)
+            if value is not None:
+                self._discard(index, value, tournament.id)
+        for trigram in self._search_trigrams(tournament):
+            self._discard(self._trigram_index, trigram, tournament.id)
+    
+    @staticmethod
+    def _discard(index: Dict[Any, Set[str]], value: Any, tournament_id: str):
+        """
+        Remove an id from an index entry, dropping the entry once it is empty.
+        """
+        ids = index[value]
+        ids.discard(tournament_id)
+        if not ids:
+            del index[value]
+    
+    def _filter_candidates(self, filters: Dict[str, Any]) -> Optional[List[TournamentRow]]:
+        """
+        Narrow a query down using the field value and search indexes.
+        
+        Equality filters on indexed fields and search terms of three or more
+        characters each contribute a set of ids; the candidates are their
+        intersection. Search candidates are a superset of the matches, since
+        the trigrams may come from different fields or positions, so callers
+        still apply every filter to the candidates.
+        
+        Args:
+            filters: Dictionary of filter criteria
+            
+        Returns:
+            Candidate rows in insertion order, or None when no filter can use an index
+        """
+        postings = [
+            self._field_index[field].get(value, set())
+            for field, value in filters.items() if field in self._field_index
+        ]
+        if 'search' in filters:
+            postings.extend(self._trigram_index.get(trigram, set()) for trigram in _trigrams(filters['search'].lower()))
+        if not postings:
+            return None
+        
+        # Intersect the posting sets, starting with the smallest
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return [self._by_id[tournament_id] for tournament_id in sorted(candidates, key=self._position.__getitem__)]
+    
     async def insert_tournament(self, tournament: Tournament) -> Dict[str, Any]:
         """
         Insert a new tournament into the mock database.
@@ -49,84 +446,134 @@ class MockDatabaseClient:
             Dictionary with inserted tournament data
         """
         try:
-            # Convert Tournament to dictionary
-            tournament_dict = tournament.dict(exclude_none=True)
-            
-            # Add an ID if not present
-            if 'id' not in tournament_dict or not tournament_dict['id']:
-                tournament_dict['id'] = str(uuid.uuid4())
-            
-            # Convert datetime objects to ISO format strings
-            if 'start_date' in tournament_dict and isinstance(tournament_dict['start_date'], datetime):
-                tournament_dict['start_date'] = tournament_dict['start_date'].isoformat()
-            if 'end_date' in tournament_dict and isinstance(tournament_dict['end_date'], datetime):
-                tournament_dict['end_date'] = tournament_dict['end_date'].isoformat()
-            if 'created_at' in tournament_dict and isinstance(tournament_dict['created_at'], datetime):
-                tournament_dict['created_at'] = tournament_dict['created_at'].isoformat()
-            if 'updated_at' in tournament_dict and isinstance(tournament_dict['updated_at'], datetime):
-                tournament_dict['updated_at'] = tournament_dict['updated_at'].isoformat()
-            
-            # Store in our list
-            self.tournaments.append(tournament_dict)
-            
-            logger.info(f"Tournament inserted into mock DB: {tournament.name}")
-            return tournament_dict
+            row, inserted = self._store(tournament)
+            if inserted:
+                logger.info("Tournament inserted into mock DB: %s", tournament.name)
+            else:
+                logger.info("Tournament already exists in mock DB, not inserted: %s", tournament.name)
+            return row.to_dict()
         except Exception as e:
-            logger.error(f"Error inserting tournament {tournament.name}: {str(e)}")
+            logger.error("Error inserting tournament %s: %s", tournament.name, e)
             raise
     
-    async def get_tournaments(self, filters: Optional[Dict[str, Any]] = None, pagination: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    def _store(self, tournament: Tournament) -> Tuple[TournamentRow, bool]:
+        """
+        Store and index a tournament unless its (name, month, year) key is already taken.
+        
+        Args:
+            tournament: Tournament model instance
+            
+        Returns:
+            Tuple of the stored row (the existing one for a duplicate) and
+            whether the tournament was inserted
+        """
+        # Convert Tournament to a row; every field is kept so None values need no filtering
+        row = TournamentRow(tournament.model_dump(mode='json'))
+        
+        # Skip duplicates, like the unique (name, month, year) key in Supabase
+        existing_id = self._by_key.get(self._key(row))
+        if existing_id is not None:
+            return self._by_id[existing_id], False
+        
+        # Add an ID if not present
+        if not row.id:
+            row.id = str(uuid.uuid4())
+        
+        # Store and index the tournament
+        self._by_id[row.id] = row
+        self._position[row.id] = self._next_position
+        self._next_position += 1
+        self._index(row)
+        return row, True
+    
+    async def upsert_tournaments(self, tournaments: List[Tournament]) -> int:
+        """
+        Insert tournaments into the mock database, skipping ones that already exist.
+        
+        Mirrors SupabaseClient.upsert_tournaments, where (name, month, year) is unique.
+        
+        Args:
+            tournaments: List of Tournament model instances
+            
+        Returns:
+            Number of tournaments that were inserted
+        """
+        # Each tournament is checked against the key index once, as it is stored
+        inserted = sum(self._store(tournament)[1] for tournament in tournaments)
+        
+        logger.info("Upserted %s tournaments into mock DB, %s new", len(tournaments), inserted)
+        return inserted
+    
+    @staticmethod
+    def _compile_filters(filters: Dict[str, Any]) -> Callable[[TournamentRow], bool]:
+        """
+        Build a predicate that checks a stored tournament against a set of filters.
+        
+        The filters are examined once per query rather than once per row: all
+        equality filters are read with a single attrgetter and compared as one
+        tuple, and the search term is lowercased up front and checked against
+        the row's stored lowercase search text.
+        
+        Args:
+            filters: Dictionary of filter criteria; 'search' matches name,
+                description or city case-insensitively, other keys must equal
+                the stored value
+            
+        Returns:
+            Function returning True for tournaments that match every filter
+        """
+        fields = [field for field in filters if field != 'search']
+        
+        # Unknown columns and None values never match, like missing keys
+        if any(field not in TournamentRow.FIELDS or filters[field] is None for field in fields):
+            return lambda tournament: False
+        
+        get_fields = attrgetter(*fields) if fields else None
+        # attrgetter returns a bare value for one field and a tuple for several
+        expected = tuple(filters[field] for field in fields)
+        if len(fields) == 1:
+            expected = expected[0]
+        
+        search_term = filters['search'].lower() if 'search' in filters else None
+        
+        def matches(tournament: TournamentRow) -> bool:
+            if get_fields is not None and get_fields(tournament) != expected:
+                return False
+            if search_term is not None:
+                return any(search_term in text for text in tournament.search_text)
+            return True
+        
+        return matches
+    
+    async def get_tournaments(self, filters: Optional[Dict[str, Any]] = None, pagination: Optional[Dict[str, int]] = None, columns: str = '*') -> Dict[str, Any]:
         """
         Retrieve tournaments from in-memory storage with optional filtering and pagination.
         
         Args:
             filters: Dictionary of filter criteria
             pagination: Dictionary with pagination parameters (page, page_size)
+            columns: Comma-separated list of columns to return, or '*' for all
             
         Returns:
             Dictionary containing data, total count, and pages information
         """
         try:
-            # Start with all tournaments
-            result = self.tournaments
+            # Start with all tournaments, the single match when the full key is given,
+            # or the candidates from the field value and search indexes
+            result = None
+            if filters and all(field in filters for field in ('name', 'month', 'year')):
+                tournament_id = self._by_key.get((filters['name'], filters['month'], filters['year']))
+                result = [self._by_id[tournament_id]] if tournament_id else []
+            elif filters:
+                result = self._filter_candidates(filters)
+            if result is None:
+                # A view over the stored rows, so unfiltered pages are sliced without copying every row
+                result = self._by_id.values()
             
             # Apply filters if provided
             if filters:
-                filtered_result = []
-                for tournament in result:
-                    match = True
-                    
-                    # Handle text search separately
-                    if 'search' in filters:
-                        search_term = filters['search'].lower()
-                        search_match = False
-                        # Search in name, description, and city
-                        if ('name' in tournament and tournament['name'] and 
-                            search_term in tournament['name'].lower()):
-                            search_match = True
-                        elif ('description' in tournament and tournament['description'] and 
-                              search_term in tournament['description'].lower()):
-                            search_match = True
-                        elif ('city' in tournament and tournament['city'] and 
-                              search_term in tournament['city'].lower()):
-                            search_match = True
-                        
-                        if not search_match:
-                            match = False
-                            continue
-                    
-                    # Apply other filters
-                    for key, value in filters.items():
-                        if key == 'search':
-                            continue  # Skip search as we handled it separately
-                        
-                        if key not in tournament or tournament[key] != value:
-                            match = False
-                            break
-                    
-                    if match:
-                        filtered_result.append(tournament)
-                result = filtered_result
+                matches = self._compile_filters(filters)
+                result = [tournament for tournament in result if matches(tournament)]
             
             # Get total count before pagination
             total_count = len(result)
@@ -138,17 +585,25 @@ class MockDatabaseClient:
                 
                 # Calculate slice indices
                 start = (page - 1) * page_size
-                end = min(start + page_size, len(result))
+                end = min(start + page_size, total_count)
                 
                 # Slice the result
-                result = result[start:end]
+                result = list(islice(result, start, end))
                 
                 # Calculate total pages
                 total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
             else:
                 total_pages = 1
             
-            logger.info(f"Retrieved {len(result)} tournaments")
+            # Convert only the returned rows to dictionaries
+            result = [row.to_dict() for row in result]
+            
+            # Project the requested columns
+            if columns != '*':
+                column_names = [column.strip() for column in columns.split(',')]
+                result = [{column: t[column] for column in column_names if column in t} for t in result]
+            
+            logger.info("Retrieved %s tournaments", len(result))
             
             # Return paginated results and metadata
             return {
@@ -157,36 +612,48 @@ class MockDatabaseClient:
                 "pages": total_pages
             }
         except Exception as e:
-            logger.error(f"Error retrieving tournaments: {str(e)}")
+            logger.error("Error retrieving tournaments: %s", e)
             raise
     
-    async def update_tournament(self, tournament_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def update_tournament(self, tournament_id: str, data: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Update a tournament in the mock database.
         
         Args:
             tournament_id: ID of the tournament to update
             data: Dictionary of fields to update
+            now: Timestamp to store as updated_at; pass one value when updating
+                many tournaments together. Defaults to the current time
             
         Returns:
             Dictionary with updated tournament data
         """
         try:
-            # Update the updated_at field
-            data['updated_at'] = datetime.utcnow().isoformat()
+            # Set the updated_at field on a copy, storing the values as Supabase would return them
+            data = orjson.loads(orjson.dumps(self._stamp_updated_at(data, now)))
             
             # Find the tournament to update
-            for i, tournament in enumerate(self.tournaments):
-                if tournament.get('id') == tournament_id:
-                    # Update the fields
-                    self.tournaments[i].update(data)
-                    logger.info(f"Tournament updated in mock DB: {tournament_id}")
-                    return self.tournaments[i]
-            
-            logger.warning(f"Tournament not found for update: {tournament_id}")
-            return {}
+            tournament = self._by_id.get(tournament_id)
+            if tournament is None:
+                logger.warning("Tournament not found for update: %s", tournament_id)
+                return {}
+            
+            # Reject a rename onto the key of another tournament, as the unique
+            # (name, month, year) constraint does in Supabase
+            new_key = tuple(data.get(field, getattr(tournament, field)) for field in ('name', 'month', 'year'))
+            owner_id = self._by_key.get(new_key)
+            if owner_id is not None and owner_id != tournament_id:
+                raise ValueError(f"Tournament {new_key} already exists with id {owner_id}")
+            
+            # Update the fields, re-indexing the tournament
+            self._unindex(tournament)
+            tournament.update(data)
+            self._index(tournament)
+            
+            logger.info("Tournament updated in mock DB: %s", tournament_id)
+            return tournament.to_dict()
         except Exception as e:
-            logger.error(f"Error updating tournament {tournament_id}: {str(e)}")
+            logger.error("Error updating tournament %s: %s", tournament_id, e)
             raise
     
     async def delete_tournament(self, tournament_id: str) -> Dict[str, Any]:
@@ -200,18 +667,20 @@ class MockDatabaseClient:
             Dictionary with deleted tournament data
         """
         try:
-            # Find the tournament to delete
-            for i, tournament in enumerate(self.tournaments):
-                if tournament.get('id') == tournament_id:
-                    # Remove the tournament
-                    deleted = self.tournaments.pop(i)
-                    logger.info(f"Tournament deleted from mock DB: {tournament_id}")
-                    return deleted
-            
-            logger.warning(f"Tournament not found for deletion: {tournament_id}")
-            return {}
+            # Remove the tournament from the indexes before dropping it, so a
+            # failure cannot leave it half-removed
+            deleted = self._by_id.get(tournament_id)
+            if deleted is None:
+                logger.warning("Tournament not found for deletion: %s", tournament_id)
+                return {}
+            
+            self._unindex(deleted)
+            del self._by_id[tournament_id]
+            del self._position[tournament_id]
+            logger.info("Tournament deleted from mock DB: %s", tournament_id)
+            return deleted.to_dict()
         except Exception as e:
-            logger.error(f"Error deleting tournament {tournament_id}: {str(e)}")
+            logger.error("Error deleting tournament %s: %s", tournament_id, e)
             raise
     
     async def check_tournament_exists(self, name: str, month: str, year: int) -> bool:
@@ -227,19 +696,28 @@ class MockDatabaseClient:
             True if the tournament exists, False otherwise
         """
         try:
-            for tournament in self.tournaments:
-                if (tournament.get('name') == name and 
-                    tournament.get('month') == month and 
-                    tournament.get('year') == year):
-                    logger.debug(f"Tournament already exists in mock DB: {name} ({month} {year})")
-                    return True
-            
-            logger.debug(f"Tournament does not exist in mock DB: {name} ({month} {year})")
+            if (name, month, year) in self._by_key:
+                logger.debug("Tournament already exists in mock DB: %s (%s %s)", name, month, year)
+                return True
+            
+            logger.debug("Tournament does not exist in mock DB: %s (%s %s)", name, month, year)
             return False
         except Exception as e:
-            logger.error(f"Error checking tournament existence: {str(e)}")
+            logger.error("Error checking tournament existence: %s", e)
             raise
 
+    async def get_existing_keys(self, keys: List[Tuple[str, str, int]]) -> Set[Tuple[str, str, int]]:
+        """
+        Find which (name, month, year) keys already exist in the in-memory database.
+        
+        Args:
+            keys: List of (name, month, year) tuples to look up
+            
+        Returns:
+            Set of the given keys that already exist
+        """
+        return {key for key in keys if key in self._by_key}
+    
     async def get_available_categories(self) -> List[str]:
         """
         Retrieve all unique tournament categories from the in-memory database.
@@ -248,15 +726,63 @@ class MockDatabaseClient:
             List of unique category values
         """
         try:
-            # Extract unique category values
-            categories = [t.category for t in self.tournaments if t.category]
+            return await self.get_distinct("category")
+        except Exception as e:
+            logger.error("Error retrieving available categories: %s", e)
+            raise
+    
+    async def get_available_tournament_types(self) -> List[str]:
+        """
+        Retrieve all unique tournament types from the in-memory database.
+        
+        Returns:
+            List of unique tournament type values
+        """
+        try:
+            return await self.get_distinct("tournament_type")
+        except Exception as e:
+            logger.error("Error retrieving available tournament types: %s", e)
+            raise
+
+    async def get_distinct(self, column: str) -> List[Any]:
+        """
+        Retrieve the sorted unique non-null values of a column from the in-memory database.
+
+        Args:
+            column: Name of the tournament column (e.g. "month", "year")
+
+        Returns:
+            Sorted list of unique values
+        """
+        try:
+            # Indexed columns already hold their distinct values; other columns need a scan
+            if column in self._field_index:
+                values = self._field_index[column].keys()
+            else:
+                values = {t[column] for t in self._by_id.values() if t.get(column) is not None}
             
-            # Return sorted unique values
-            return sorted(list(set(categories)))
+            # Months are ordered by calendar position, like the Supabase views
+            if column == "month":
+                return sorted(values, key=lambda month: (MONTH_ORDER.get(month, len(MONTH_ORDER)), month))
+            return sorted(values)
         except Exception as e:
-            logger.error(f"Error retrieving available categories: {str(e)}")
+            logger.error("Error retrieving distinct values for %s: %s", column, e)
             raise
 
+    async def get_enumerations(self) -> Dict[str, List[Any]]:
+        """
+        Retrieve the distinct months, years, categories and tournament types at once.
+
+        Returns:
+            Dictionary with "months", "years", "categories" and "tournament_types" lists
+        """
+        return {
+            "months": await self.get_distinct("month"),
+            "years": await self.get_distinct("year"),
+            "categories": await self.get_distinct("category"),
+            "tournament_types": await self.get_distinct("tournament_type")
+        }
+
     async def record_crawl_history(self, tournaments_count: int, status: str = "success", error: str = None) -> Dict[str, Any]:
         """
         Record a crawl operation in the mock crawl history.
@@ -269,11 +795,13 @@ class MockDatabaseClient:
         Returns:
             Dictionary with inserted crawl history data
         """
+        # Take the timestamp once for both the record and the failure result
+        timestamp = datetime.utcnow().isoformat()
         try:
             # Create crawl history record
             crawl_data = {
                 "id": str(uuid.uuid4()),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
                 "tournaments_count": tournaments_count,
                 "status": status
             }
@@ -284,53 +812,57 @@ class MockDatabaseClient:
             # Add to in-memory crawl history
             self.crawl_history.append(crawl_data)
             
-            logger.info(f"Mock crawl history recorded: {status}, processed {tournaments_count} tournaments")
+            logger.info("Mock crawl history recorded: %s, processed %s tournaments", status, tournaments_count)
             return crawl_data
         except Exception as e:
-            logger.error(f"Error recording mock crawl history: {str(e)}")
+            logger.error("Error recording mock crawl history: %s", e)
             return {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
                 "tournaments_count": tournaments_count,
                 "status": "failed_to_record",
                 "error": str(e)
             }
 
-class SupabaseClient:
+class SupabaseClient(DatabaseClient):
     """
     Service class for interacting with Supabase database.
     """
-    _instance = None
-    
-    def __new__(cls):
-        """
-        Implements the Singleton pattern to ensure only one database connection.
-        """
-        if cls._instance is None:
-            cls._instance = super(SupabaseClient, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
     
     def _initialize(self):
         """
         Initialize the Supabase client.
         """
         try:
-            supabase_url = os.getenv("SUPABASE_URL")
+            settings = get_settings()
+            supabase_url = settings.supabase_url
             
             # Explicitly use the service role key to bypass RLS policies
-            supabase_key = os.getenv("SUPABASE_SERVICE_ROLE")
+            supabase_key = settings.supabase_service_role
             if not supabase_key:
-                supabase_key = os.getenv("SUPABASE_KEY")
+                supabase_key = settings.supabase_key
                 logger.warning("SUPABASE_SERVICE_ROLE not found, using SUPABASE_KEY instead. This may cause RLS policy issues.")
             
             if not supabase_url or not supabase_key:
                 raise ValueError("Supabase credentials not found in environment variables")
             
-            logger.info(f"Initializing Supabase client with URL: {supabase_url} (key length: {len(supabase_key) if supabase_key else 0})")
-            self.client = create_client(supabase_url, supabase_key)
+            logger.info("Initializing Supabase client with URL: %s (key length: %s)", supabase_url, len(supabase_key) if supabase_key else 0)
+            # Share one keep-alive HTTP/2 connection pool across every query
+            self.http_client = _OrjsonHttpClient(
+                limits=SUPABASE_HTTP_LIMITS,
+                timeout=SUPABASE_HTTP_TIMEOUT,
+                http2=True
+            )
+            # The service key is sent as the bearer token, so there is no auth
+            # session to restore and the client can be built without awaiting
+            # create_async_client()
+            self.client = AsyncClient(
+                supabase_url,
+                supabase_key,
+                options=AsyncClientOptions(httpx_client=self.http_client)
+            )
             
             # Get table prefix
-            self.table_prefix = os.getenv("SUPABASE_TABLE_PREFIX", "ct_")
+            self.table_prefix = settings.supabase_table_prefix
             
             # Define all table names
             self.tournaments_table = f"{self.table_prefix}tournaments"
@@ -341,30 +873,60 @@ class SupabaseClient:
             # Use tournaments table for backward compatibility
             self.table_name = self.tournaments_table
             
-            logger.info(f"Supabase client initialized successfully. Using tables with prefix: {self.table_prefix}")
+            logger.info("Supabase client initialized successfully. Using tables with prefix: %s", self.table_prefix)
             
-            # Test connection
-            self._test_connection()
+            # The connection is verified by the first real query rather than an extra probe request
+            self._connection_verified = False
+            
+            # Crawl history column that receives error text; looked up on the first failed crawl
+            self._crawl_history_error_column: Optional[str] = None
+            self._crawl_history_error_column_resolved = False
+            
+            # Category and tournament type lists with the monotonic time they were read
+            self._lookup_cache: Dict[str, Tuple[float, List[str]]] = {}
         except Exception as e:
-            logger.error(f"Failed to initialize Supabase client: {str(e)}")
+            logger.error("Failed to initialize Supabase client: %s", e)
             raise
     
-    def _test_connection(self):
+    async def _execute(self, query):
         """
-        Test the Supabase connection by fetching a single row limit
+        Execute a supabase-py query on the shared async connection pool.
+        
+        The first query also serves as the connection test, so startup does
+        not spend a round trip on a probe.
+        
+        Args:
+            query: PostgREST request builder to execute
+            
+        Returns:
+            The query's API response
         """
         try:
-            # Try a simple query to verify connection
-            response = self.client.table(self.table_name).select("id").limit(1).execute()
-            logger.info("Supabase connection test successful")
+            response = await query.execute()
         except Exception as e:
-            logger.error(f"Supabase connection test failed: {str(e)}")
+            if not self._connection_verified:
+                logger.error("Supabase connection test failed: %s", e)
             raise
+        
+        if not self._connection_verified:
+            self._connection_verified = True
+            logger.info("Supabase connection test successful")
+        return response
+    
+    async def close(self):
+        """
+        Close the Supabase connection pool.
+        """
+        await self.http_client.aclose()
     
     async def insert_tournament(self, tournament: Tournament) -> Dict[str, Any]:
         """
         Insert a new tournament into Supabase.
         
+        Uses a single INSERT ... ON CONFLICT (name, month, year) DO NOTHING, so
+        no existence check is needed beforehand and concurrent writers cannot
+        create duplicates.
+        
         Args:
             tournament: Tournament model instance
             
@@ -372,90 +934,121 @@ class SupabaseClient:
             Dictionary with inserted tournament data
         """
         try:
-            # Convert Tournament to dictionary
-            tournament_dict = tournament.dict(exclude_none=True)
-            
-            # Remove id if it's None (let Supabase generate one)
-            if 'id' in tournament_dict and tournament_dict['id'] is None:
-                del tournament_dict['id']
-            
-            # Convert datetime objects to ISO format strings for JSON compatibility
-            if 'start_date' in tournament_dict and tournament_dict['start_date']:
-                tournament_dict['start_date'] = tournament_dict['start_date'].isoformat()
-            if 'end_date' in tournament_dict and tournament_dict['end_date']:
-                tournament_dict['end_date'] = tournament_dict['end_date'].isoformat()
-            if 'created_at' in tournament_dict:
-                tournament_dict['created_at'] = tournament_dict['created_at'].isoformat()
-            if 'updated_at' in tournament_dict:
-                tournament_dict['updated_at'] = tournament_dict['updated_at'].isoformat()
+            # Convert Tournament to a row dictionary
+            tournament_dict = _serialize(tournament)
             
             # Log the data being inserted
-            logger.debug(f"Attempting to insert tournament into {self.tournaments_table}: {tournament.name}")
-            logger.debug(f"Tournament data: {tournament_dict}")
+            logger.debug("Attempting to insert tournament into %s: %s", self.tournaments_table, tournament.name)
+            logger.debug("Tournament data: %s", tournament_dict)
             
-            # Insert data into Supabase
-            response = self.client.table(self.tournaments_table).insert(tournament_dict).execute()
+            # Insert data into Supabase, skipping it if the tournament already exists
+            query = self.client.table(self.tournaments_table) \
+                .upsert(tournament_dict, on_conflict='name,month,year', ignore_duplicates=True)
+            response = await self._execute(query)
             
             # Extract the inserted record
-            if response.data and len(response.data) > 0:
-                inserted_record = response.data[0]
-                logger.info(f"Tournament inserted: {tournament.name}")
+            inserted_record = _first(response)
+            if inserted_record is not None:
+                logger.info("Tournament inserted: %s", tournament.name)
                 return inserted_record
             else:
-                logger.warning(f"No data returned after inserting tournament: {tournament.name}")
-                # Log the response for debugging
-                logger.debug(f"Supabase response: {response}")
-                return tournament_dict
+                logger.info("Tournament already exists, not inserted: %s", tournament.name)
+                # Match the JSON shape of a returned row, with datetimes as ISO strings
+                return tournament.model_dump(mode="json", exclude_none=True)
         except Exception as e:
             # Special handling for RLS errors
             if "violates row-level security policy" in str(e):
-                logger.error(f"RLS policy violation inserting tournament {tournament.name}. This usually means the Supabase key doesn't have permission to insert data.")
-                logger.error(f"Check if you're using the service role key or if RLS policies are configured correctly.")
+                logger.error("RLS policy violation inserting tournament %s. This usually means the Supabase key doesn't have permission to insert data.", tournament.name)
+                logger.error("Check if you're using the service role key or if RLS policies are configured correctly.")
                 
                 # Try to check RLS settings
                 try:
                     # Try a simple select to check if we can read at least
-                    self.client.table(self.tournaments_table).select("id").limit(1).execute()
+                    await self._execute(self.client.table(self.tournaments_table).select("id").limit(1))
                     logger.info("Can read from the table but not write - likely an RLS policy issue")
                 except Exception as e2:
-                    logger.error(f"Also can't read from the table: {str(e2)}")
+                    logger.error("Also can't read from the table: %s", e2)
             
             # Log detailed error information
-            logger.error(f"Error inserting tournament {tournament.name}: {str(e)}")
-            logger.debug(f"Tournament data: {tournament_dict}")
+            logger.error("Error inserting tournament %s: %s", tournament.name, e)
+            logger.debug("Tournament data: %s", tournament_dict)
+            raise
+    
+    async def upsert_tournaments(self, tournaments: List[Tournament]) -> int:
+        """
+        Insert tournaments in bulk, skipping ones that already exist.
+        
+        Relies on the unique (name, month, year) constraint from
+        supabase/migrations/0002_tournament_unique_key.sql, so Postgres resolves
+        duplicates with one INSERT ... ON CONFLICT DO NOTHING per chunk of
+        INSERT_CHUNK_SIZE rows. Inserted rows are not sent back; PostgREST only
+        reports how many there were.
+        
+        Args:
+            tournaments: List of Tournament model instances
+            
+        Returns:
+            Number of tournaments that were inserted
+        """
+        if not tournaments:
+            return 0
+        
+        try:
+            rows = _serialize_many(tournaments)
+            
+            logger.debug("Attempting to upsert %s tournaments into %s", len(rows), self.tournaments_table)
+            
+            # Send one request per chunk of rows, getting back only the inserted count
+            inserted = 0
+            for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                query = self.client.table(self.tournaments_table) \
+                    .upsert(rows[start:start + INSERT_CHUNK_SIZE], on_conflict='name,month,year', ignore_duplicates=True,
+                            count='exact', returning='minimal')
+                response = await self._execute(query)
+                inserted += response.count or 0
+            
+            # New rows may carry new categories or types
+            if inserted:
+                self._lookup_cache.clear()
+            
+            logger.info("Upserted %s tournaments, %s new", len(rows), inserted)
+            return inserted
+        except Exception as e:
+            logger.error("Error upserting %s tournaments: %s", len(tournaments), e)
             raise
     
-    async def get_tournaments(self, filters: Optional[Dict[str, Any]] = None, pagination: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    async def get_tournaments(self, filters: Optional[Dict[str, Any]] = None, pagination: Optional[Dict[str, int]] = None, columns: str = '*') -> Dict[str, Any]:
         """
         Retrieve tournaments from Supabase with optional filtering and pagination.
         
         Args:
             filters: Dictionary of filter criteria
             pagination: Dictionary with pagination parameters (page, page_size)
+            columns: Comma-separated list of columns to return, or '*' for all
             
         Returns:
             Dictionary containing data, total count, and pages information
         """
         try:
-            # Start with a base query
-            query = self.client.table(self.tournaments_table).select('*', count='exact')
+            # Start with a base query; for a page, count='exact' returns the total alongside it.
+            # Without pagination every row comes back, so the rows are counted here instead
+            query = self.client.table(self.tournaments_table).select(columns, count='exact' if pagination else None)
+            
+            # Copy filters so the caller's dictionary is left untouched
+            filters = dict(filters) if filters else {}
             
             # Apply text search if provided
-            if filters and 'search' in filters:
+            if 'search' in filters:
                 search_term = filters.pop('search')
-                # Search in name and description fields
+                # Search in name, description and city, served by the trigram indexes
+                # from supabase/migrations/0003_tournament_search_trigram.sql
                 query = query.or_(f"name.ilike.%{search_term}%,description.ilike.%{search_term}%,city.ilike.%{search_term}%")
             
-            # Apply remaining filters if provided
-            if filters:
-                for key, value in filters.items():
-                    query = query.eq(key, value)
-            
-            # Get total count first
-            count_response = query.execute()
-            total_count = count_response.count
+            # Apply remaining filters
+            for key, value in filters.items():
+                query = query.eq(key, value)
             
-            # Apply pagination if provided
+            # Apply pagination if provided, so only the requested page is fetched
             if pagination:
                 page = pagination.get('page', 1)
                 page_size = pagination.get('page_size', 10)
@@ -466,18 +1059,20 @@ class SupabaseClient:
                 
                 # Add range to query
                 query = query.range(start, end)
-                
-                # Calculate total pages
+            
+            # Execute the query once for both the page and the total count
+            response = await self._execute(query)
+            total_count = (response.count or 0) if pagination else len(response.data or [])
+            
+            # Calculate total pages
+            if pagination:
                 total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
             else:
                 total_pages = 1
             
-            # Execute the query
-            response = query.execute()
-            
             data = []
             if response.data:
-                logger.info(f"Retrieved {len(response.data)} tournaments")
+                logger.info("Retrieved %s tournaments", len(response.data))
                 data = response.data
             else:
                 logger.info("No tournaments found")
@@ -489,36 +1084,38 @@ class SupabaseClient:
                 "pages": total_pages
             }
         except Exception as e:
-            logger.error(f"Error retrieving tournaments: {str(e)}")
+            logger.error("Error retrieving tournaments: %s", e)
             raise
     
-    async def update_tournament(self, tournament_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def update_tournament(self, tournament_id: str, data: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Update a tournament in Supabase.
         
         Args:
             tournament_id: ID of the tournament to update
             data: Dictionary of fields to update
+            now: Timestamp to store as updated_at; pass one value when updating
+                many tournaments together. Defaults to the current time
             
         Returns:
             Updated tournament data dictionary
         """
         try:
-            # Update the updated_at field
-            data['updated_at'] = datetime.utcnow().isoformat()
+            # Set the updated_at field on a copy, leaving the caller's dictionary untouched
+            data = self._stamp_updated_at(data, now)
             
             # Update tournament in Supabase
-            response = self.client.table(self.tournaments_table).update(data).eq('id', tournament_id).execute()
+            response = await self._execute(self.client.table(self.tournaments_table).update(data).eq('id', tournament_id))
             
-            if response.data and len(response.data) > 0:
-                updated_record = response.data[0]
-                logger.info(f"Tournament updated: {tournament_id}")
+            updated_record = _first(response)
+            if updated_record is not None:
+                logger.info("Tournament updated: %s", tournament_id)
                 return updated_record
             else:
-                logger.warning(f"No data returned after updating tournament: {tournament_id}")
+                logger.warning("No data returned after updating tournament: %s", tournament_id)
                 return {}
         except Exception as e:
-            logger.error(f"Error updating tournament {tournament_id}: {str(e)}")
+            logger.error("Error updating tournament %s: %s", tournament_id, e)
             raise
     
     async def delete_tournament(self, tournament_id: str) -> Dict[str, Any]:
@@ -532,24 +1129,58 @@ class SupabaseClient:
             Deleted tournament data dictionary
         """
         try:
-            # First get the tournament to return it
-            get_response = self.client.table(self.tournaments_table).select("*").eq('id', tournament_id).execute()
-            
-            if not get_response.data or len(get_response.data) == 0:
-                logger.warning(f"Tournament not found for deletion: {tournament_id}")
+            # Delete the tournament, getting the deleted row back in the same request
+            query = self.client.table(self.tournaments_table) \
+                .delete(returning='representation') \
+                .eq('id', tournament_id)
+            response = await self._execute(query)
+            
+            deleted_tournament = _first(response)
+            if deleted_tournament is None:
+                logger.warning("Tournament not found for deletion: %s", tournament_id)
                 return {}
             
-            deleted_tournament = get_response.data[0]
-            
-            # Delete tournament from Supabase
-            response = self.client.table(self.tournaments_table).delete().eq('id', tournament_id).execute()
-            
-            logger.info(f"Tournament deleted: {tournament_id}")
+            logger.info("Tournament deleted: %s", tournament_id)
             return deleted_tournament
         except Exception as e:
-            logger.error(f"Error deleting tournament {tournament_id}: {str(e)}")
+            logger.error("Error deleting tournament %s: %s", tournament_id, e)
             raise
     
+    async def iter_tournaments(self, columns: str = '*', page_size: int = TOURNAMENT_PAGE_SIZE) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every tournament in Supabase, fetching one range of rows at a time.
+        
+        Rows are ordered by id so consecutive ranges neither skip nor repeat rows,
+        and no total count is requested.
+        
+        Args:
+            columns: Comma-separated list of columns to return, or '*' for all
+            page_size: Number of rows to fetch per request
+            
+        Yields:
+            Tournament rows as dictionaries
+        """
+        offset = 0
+        while True:
+            try:
+                query = self.client.table(self.tournaments_table) \
+                    .select(columns) \
+                    .order('id') \
+                    .range(offset, offset + page_size - 1)
+                response = await self._execute(query)
+            except Exception as e:
+                logger.error("Error iterating over tournaments at offset %s: %s", offset, e)
+                raise
+            
+            rows = response.data or []
+            for row in rows:
+                yield row
+            
+            # A short page is the last one
+            if len(rows) < page_size:
+                return
+            offset += page_size
+    
     async def check_tournament_exists(self, name: str, month: str, year: int) -> bool:
         """
         Check if a tournament with the same name, month, and year already exists.
@@ -563,20 +1194,87 @@ class SupabaseClient:
             True if a matching tournament exists, False otherwise
         """
         try:
-            # Query for matching tournament
-            response = self.client.table(self.tournaments_table) \
-                .select('id') \
+            # Count matching tournaments with a HEAD request, so no row body is sent back
+            query = self.client.table(self.tournaments_table) \
+                .select('id', count='exact', head=True) \
                 .eq('name', name) \
                 .eq('month', month) \
-                .eq('year', year) \
-                .execute()
+                .eq('year', year)
+            response = await self._execute(query)
+            
+            # Return True if there are any matches
+            return (response.count or 0) > 0
+        except Exception as e:
+            logger.error("Error checking if tournament exists: %s", e)
+            raise
+    
+    async def get_existing_keys(self, keys: List[Tuple[str, str, int]]) -> Set[Tuple[str, str, int]]:
+        """
+        Find which (name, month, year) keys already exist, using one query per chunk of names.
+        
+        Args:
+            keys: List of (name, month, year) tuples to look up
+            
+        Returns:
+            Set of the given keys that already exist
+        """
+        wanted = set(keys)
+        names = sorted({name for name, _, _ in wanted})
+        years = sorted({year for _, _, year in wanted})
+        existing = set()
+        
+        try:
+            # Chunk the names so the IN (...) filter stays within URL length limits
+            for start in range(0, len(names), EXISTING_KEYS_CHUNK_SIZE):
+                query = self.client.table(self.tournaments_table) \
+                    .select('name,month,year') \
+                    .in_('name', names[start:start + EXISTING_KEYS_CHUNK_SIZE]) \
+                    .in_('year', years)
+                response = await self._execute(query)
+                
+                for item in response.data or []:
+                    key = (item['name'], item['month'], item['year'])
+                    if key in wanted:
+                        existing.add(key)
             
-            # Return True if there are any results
-            return response.data and len(response.data) > 0
+            logger.debug("%s of %s tournaments already exist", len(existing), len(wanted))
+            return existing
         except Exception as e:
-            logger.error(f"Error checking if tournament exists: {str(e)}")
+            logger.error("Error checking which tournaments exist: %s", e)
             raise
     
+    async def _get_lookup(self, table: str, column: str) -> List[str]:
+        """
+        Retrieve the names in a lookup table, reusing the result for LOOKUP_CACHE_TTL seconds.
+        
+        Falls back to the distinct values of the given tournament column when
+        the lookup table is empty. Both sources are already deduplicated and
+        ordered by Postgres, so only the distinct names are transferred.
+        
+        Args:
+            table: Name of the lookup table (e.g. the categories table)
+            column: Tournament column to read distinct values from instead
+            
+        Returns:
+            List of unique names
+        """
+        cached = self._lookup_cache.get(table)
+        if cached is not None and time.monotonic() - cached[0] < LOOKUP_CACHE_TTL:
+            return cached[1]
+        
+        # Try to get from the lookup table first
+        response = await self._execute(self.client.table(table).select('name').order('name'))
+        
+        if response.data:
+            # Extract names from the dedicated table
+            names = [item['name'] for item in response.data if 'name' in item]
+        else:
+            # Fallback: Read distinct values from the tournaments table if the lookup table is empty
+            names = await self.get_distinct(column)
+        
+        self._lookup_cache[table] = (time.monotonic(), names)
+        return names
+    
     async def get_available_categories(self) -> List[str]:
         """
         Retrieve all unique tournament categories from the database.
@@ -585,27 +1283,9 @@ class SupabaseClient:
             List of unique category values
         """
         try:
-            # Try to get from categories table first
-            response = self.client.table(self.categories_table).select('name').execute()
-            
-            if response.data and len(response.data) > 0:
-                # Extract category names from the dedicated table
-                categories = [item['name'] for item in response.data if 'name' in item]
-                return sorted(categories)
-            
-            # Fallback: Extract from tournaments table if categories table is empty
-            response = self.client.table(self.tournaments_table).select('category').execute()
-            
-            # Extract unique category values
-            categories = []
-            if response.data:
-                categories = [item['category'] for item in response.data 
-                             if 'category' in item and item['category']]
-            
-            # Return sorted unique values
-            return sorted(list(set(categories)))
+            return list(await self._get_lookup(self.categories_table, "category"))
         except Exception as e:
-            logger.error(f"Error retrieving available categories: {str(e)}")
+            logger.error("Error retrieving available categories: %s", e)
             raise
     
     async def get_available_tournament_types(self) -> List[str]:
@@ -616,29 +1296,88 @@ class SupabaseClient:
             List of unique tournament type values
         """
         try:
-            # Try to get from types table first
-            response = self.client.table(self.types_table).select('name').execute()
-            
-            if response.data and len(response.data) > 0:
-                # Extract type names from the dedicated table
-                types = [item['name'] for item in response.data if 'name' in item]
-                return sorted(types)
-                
-            # Fallback: Extract from tournaments table if types table is empty
-            response = self.client.table(self.tournaments_table).select('tournament_type').execute()
-            
-            # Extract unique tournament type values
-            types = []
-            if response.data:
-                types = [item['tournament_type'] for item in response.data 
-                        if 'tournament_type' in item and item['tournament_type']]
-            
-            # Return sorted unique values
-            return sorted(list(set(types)))
+            return list(await self._get_lookup(self.types_table, "tournament_type"))
         except Exception as e:
-            logger.error(f"Error retrieving available tournament types: {str(e)}")
+            logger.error("Error retrieving available tournament types: %s", e)
             raise
 
+    async def get_distinct(self, column: str) -> List[Any]:
+        """
+        Retrieve the unique values of a tournament column.
+
+        Reads from the "<prefix>distinct_<column>" view (see
+        supabase/migrations/0001_distinct_views.sql), which groups and orders
+        the values inside Postgres so only the distinct values are transferred.
+
+        Args:
+            column: Name of the tournament column (e.g. "month", "year")
+
+        Returns:
+            List of unique values, ordered by the view
+        """
+        try:
+            view_name = f"{self.table_prefix}distinct_{column}"
+            response = await self._execute(self.client.table(view_name).select(column))
+
+            return [item[column] for item in response.data or []]
+        except Exception as e:
+            logger.error("Error retrieving distinct values for %s: %s", column, e)
+            raise
+
+    async def get_enumerations(self) -> Dict[str, List[Any]]:
+        """
+        Retrieve the distinct months, years, categories and tournament types in one request.
+
+        Reads the single row of the "<prefix>tournament_enumerations" materialized
+        view (see supabase/migrations/0004_tournament_enumerations.sql), which
+        Postgres refreshes whenever the tournaments table changes.
+
+        Returns:
+            Dictionary with "months", "years", "categories" and "tournament_types" lists
+        """
+        try:
+            view_name = f"{self.table_prefix}tournament_enumerations"
+            query = self.client.table(view_name) \
+                .select("months,years,categories,tournament_types") \
+                .limit(1)
+            response = await self._execute(query)
+
+            row = _first(response) or {}
+            return {
+                "months": row.get("months") or [],
+                "years": row.get("years") or [],
+                "categories": row.get("categories") or [],
+                "tournament_types": row.get("tournament_types") or []
+            }
+        except Exception as e:
+            logger.error("Error retrieving tournament enumerations: %s", e)
+            raise
+
+    async def _get_crawl_history_error_column(self) -> Optional[str]:
+        """
+        Find which crawl history column can hold an error message.
+        
+        Probes for an "error" column, then a "message" column, the first time
+        it is needed and remembers the answer for the life of the client.
+        Connection failures are raised rather than remembered, so a later
+        crawl probes again.
+        
+        Returns:
+            "error", "message", or None if neither column exists
+        """
+        if not self._crawl_history_error_column_resolved:
+            for column in ("error", "message"):
+                try:
+                    await self._execute(self.client.table(self.crawl_history_table).select(column).limit(1))
+                    self._crawl_history_error_column = column
+                    break
+                except APIError as e:
+                    logger.warning("%s column not found in %s table: %s", column.capitalize(), self.crawl_history_table, e)
+            else:
+                logger.warning("Neither error nor message columns found in %s", self.crawl_history_table)
+            self._crawl_history_error_column_resolved = True
+        return self._crawl_history_error_column
+    
     async def record_crawl_history(self, tournaments_count: int, status: str = "success", error: str = None) -> Dict[str, Any]:
         """
         Record a crawl operation in the crawl history table.
@@ -651,76 +1390,104 @@ class SupabaseClient:
         Returns:
             Dictionary with inserted crawl history data
         """
+        # Take the timestamp once for both the record and the failure result
+        timestamp = datetime.utcnow()
         try:
             # Create crawl history record with only the columns that exist
             crawl_data = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp,
                 "tournaments_count": tournaments_count,
                 "status": status
             }
             
             # Only add error if the column exists and there is an error
             if error:
-                # Check if the error column exists in the table
-                try:
-                    # Use a simple select to check if the column exists
-                    self.client.table(self.crawl_history_table).select("error").limit(1).execute()
-                    # If no error, the column exists
+                error_column = await self._get_crawl_history_error_column()
+                if error_column == "error":
                     crawl_data["error"] = error
-                except Exception as e:
-                    logger.warning(f"Error column not found in {self.crawl_history_table} table: {str(e)}")
-                    # If the error column doesn't exist, add the error to a message field if available
-                    try:
-                        self.client.table(self.crawl_history_table).select("message").limit(1).execute()
-                        crawl_data["message"] = f"Error: {error}"
-                    except:
-                        # Neither error nor message columns exist
-                        logger.warning(f"Neither error nor message columns found in {self.crawl_history_table}")
+                elif error_column == "message":
+                    crawl_data["message"] = f"Error: {error}"
                 
             # Insert into crawl history table
-            response = self.client.table(self.crawl_history_table).insert(crawl_data).execute()
+            response = await self._execute(self.client.table(self.crawl_history_table).insert(crawl_data))
             
-            if response.data and len(response.data) > 0:
-                logger.info(f"Crawl history recorded: {status}, processed {tournaments_count} tournaments")
-                return response.data[0]
+            recorded = _first(response)
+            if recorded is not None:
+                logger.info("Crawl history recorded: %s, processed %s tournaments", status, tournaments_count)
+                return recorded
             else:
-                logger.warning(f"No data returned after inserting crawl history")
+                logger.warning("No data returned after inserting crawl history")
                 return crawl_data
         except Exception as e:
-            logger.error(f"Error recording crawl history: {str(e)}")
+            logger.error("Error recording crawl history: %s", e)
             # Don't raise the exception - we don't want crawl history recording to break the main flow
             return {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp.isoformat(),
                 "tournaments_count": tournaments_count,
                 "status": "failed_to_record"
             }
 
-def get_database_client():
+@lru_cache(maxsize=None)
+def get_supabase_client() -> SupabaseClient:
+    """
+    Get the process-wide Supabase client, creating it on first use.
+    
+    A client that fails to initialize is not cached, so the next call retries.
+    
+    Returns:
+        Shared SupabaseClient instance
+    """
+    return SupabaseClient()
+
+@lru_cache(maxsize=None)
+def get_mock_client() -> MockDatabaseClient:
+    """
+    Get the process-wide in-memory database client, creating it on first use.
+    
+    Returns:
+        Shared MockDatabaseClient instance
+    """
+    return MockDatabaseClient()
+
+# Client chosen by get_database_client, reused by later calls
+_database_client: Optional[DatabaseClient] = None
+
+def get_database_client() -> DatabaseClient:
     """
     Factory function to get the appropriate database client.
     Returns a MockDatabaseClient if Supabase credentials are not set,
     otherwise returns a SupabaseClient.
+    
+    The choice is made once per process. A mock client used as a fallback
+    after a Supabase error is not remembered, so later calls retry Supabase.
     """
+    global _database_client
+    if _database_client is not None:
+        return _database_client
+    
     try:
+        settings = get_settings()
+        
         # Check if mock database is explicitly requested
-        use_mock_db = os.getenv("USE_MOCK_DB", "false").lower() == "true"
-        if use_mock_db:
+        if settings.use_mock_db:
             logger.info("Using mock database client (USE_MOCK_DB=true)")
-            return MockDatabaseClient()
+            _database_client = get_mock_client()
+            return _database_client
         
         # Check for Supabase credentials
-        supabase_url = os.getenv("SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_SERVICE_ROLE")
+        supabase_url = settings.supabase_url
+        supabase_key = settings.supabase_service_role
         if not supabase_key:
-            supabase_key = os.getenv("SUPABASE_KEY")
+            supabase_key = settings.supabase_key
             logger.warning("SUPABASE_SERVICE_ROLE not found, using SUPABASE_KEY instead. This may cause RLS policy issues.")
         
         if supabase_url and supabase_key:
             logger.info("Using Supabase database client")
-            return SupabaseClient()
+            _database_client = get_supabase_client()
         else:
             logger.info("Using mock database client (Supabase credentials not found)")
-            return MockDatabaseClient()
+            _database_client = get_mock_client()
+        return _database_client
     except Exception as e:
-        logger.error(f"Error creating database client: {str(e)}. Falling back to mock client.")
-        return MockDatabaseClient() 
\ No newline at end of file
+        logger.error("Error creating database client: %s. Falling back to mock client.", e)
+        return get_mock_client()
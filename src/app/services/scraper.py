@@ -1,83 +1,340 @@
-import os
+import asyncio
 import logging
-import requests
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+import aiohttp
+from typing import List, Dict, Any, Optional, Tuple
+from bs4 import BeautifulSoup, NavigableString
 import re
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import chain, islice
+from operator import itemgetter
 from datetime import datetime
-from dotenv import load_dotenv
 
+from ..config import get_settings
 from ..models.tournament import Tournament
 
-# Load environment variables
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
+# Connection pool for the scraper's own session: a few keep-alive connections to the target host
+SCRAPER_CONNECTION_LIMIT = 10
+SCRAPER_CONNECTIONS_PER_HOST = 4
+
+# Compressions advertised to the server; aiohttp decodes brotli only when a brotli package is installed
+ACCEPT_ENCODING = "gzip, deflate, br" if find_spec("brotli") or find_spec("brotlicffi") else "gzip, deflate"
+
+# Number of distinct tournament names whose classification is remembered
+CLASSIFIER_CACHE_SIZE = 1024
+
+# Patterns used while parsing, compiled once at import time
+YEAR_PATTERN = re.compile(r'(\d{4})')
+TOURNAMENT_NAME_PATTERN = re.compile(r'(Open|Championship|Tournament|Cup|Masters|Schach|Turnier)', re.IGNORECASE)
+CITY_PATTERN = re.compile(r'in\s+([A-Z][a-zäöüß]+(?:\s+[A-Z][a-zäöüß]+)?)')
+
+# Tournament types found in the original name, one named group per type, in order of priority
+TOURNAMENT_TYPE_PATTERN = re.compile(r'(?P<Rapid>Rapid|Schnell)|(?P<Blitz>Blitz)|(?P<Online>Online|Internet)', re.IGNORECASE)
+TOURNAMENT_TYPE_PRIORITY = ("Rapid", "Blitz", "Online")
+
+# Categories found in the lowercased name, one named group per category, in order of priority
+CATEGORY_PATTERN = re.compile(r'(?P<Youth>junior|jugend|youth|u\d+)|(?P<Women>women|frauen|damen)|(?P<Senior>senior|senioren)|(?P<Team>team|mannschaft|verein)')
+CATEGORY_PRIORITY = ("Youth", "Women", "Senior", "Team")
+
+# Common German month names, and abbreviated English ones
+GERMAN_MONTH_NAMES = [
+    "Januar", "Februar", "März", "April", "Mai", "Juni",
+    "Juli", "August", "September", "Oktober", "November", "Dezember"
+]
+MONTH_ABBREVIATIONS = [
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
+]
+
+# Month names that mark the start of a month section: German names, then English abbreviations
+MONTH_NAMES = GERMAN_MONTH_NAMES + MONTH_ABBREVIATIONS
+MONTH_NAMES_PATTERN = re.compile("|".join(map(re.escape, MONTH_NAMES)))
+
+# Lookups used to keep month names themselves out of the tournament names
+MONTH_ABBREVIATION_SET = frozenset(MONTH_ABBREVIATIONS)
+GERMAN_MONTH_NAMES_PATTERN = re.compile("|".join(map(re.escape, GERMAN_MONTH_NAMES)))
+
+# Tags whose text is likely to be a tournament name: links, strong/b tags and headings
+NAME_TAGS = frozenset(['a', 'strong', 'b', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+# English name for each German or abbreviated month name
+MONTH_NAME_MAPPING = {
+    "Januar": "January",
+    "Februar": "February",
+    "März": "March",
+    "April": "April",
+    "Mai": "May",
+    "Juni": "June",
+    "Juli": "July",
+    "August": "August",
+    "September": "September",
+    "Oktober": "October",
+    "November": "November",
+    "Dezember": "December",
+    "Jan": "January",
+    "Feb": "February",
+    "Mar": "March",
+    "Apr": "April",
+    "May": "May",
+    "Jun": "June",
+    "Jul": "July",
+    "Aug": "August",
+    "Sep": "September",
+    "Oct": "October",
+    "Nov": "November",
+    "Dec": "December"
+}
+
+# Keywords that mark a tournament as international, matched case-insensitively
+INTERNATIONAL_KEYWORDS = [
+    "International", "World", "European", "Europe", "FIDE",
+    "Weltmeisterschaft", "Europameisterschaft"
+]
+INTERNATIONAL_PATTERN = re.compile("|".join(re.escape(keyword.lower()) for keyword in INTERNATIONAL_KEYWORDS))
+
+# List of common German cities, in order of preference when a name mentions several
+COMMON_CITIES = [
+    "Berlin", "Hamburg", "München", "Köln", "Frankfurt", "Stuttgart",
+    "Düsseldorf", "Leipzig", "Dortmund", "Essen", "Dresden", "Bremen",
+    "Hannover", "Nürnberg", "Duisburg", "Bochum", "Wuppertal", "Bonn",
+    "Mannheim", "Karlsruhe", "Münster", "Wiesbaden", "Augsburg"
+]
+COMMON_CITIES_PATTERN = re.compile("|".join(map(re.escape, COMMON_CITIES)))
+
+# List of common European countries, in order of preference when a name mentions several
+COMMON_COUNTRIES = [
+    "Germany", "France", "Spain", "Italy", "Netherlands", "Belgium",
+    "Austria", "Switzerland", "Denmark", "Sweden", "Norway", "Finland",
+    "Poland", "Czech Republic", "Hungary", "Romania", "Bulgaria",
+    "Greece", "Portugal", "Ireland", "UK", "United Kingdom"
+]
+COMMON_COUNTRIES_PATTERN = re.compile("|".join(map(re.escape, COMMON_COUNTRIES)))
+
+def _first_listed(pattern: re.Pattern, words: List[str], text: str) -> Optional[str]:
+    """
+    Find which of a list of words, in list order, is the first to occur in text.
+    
+    The text is scanned once with an alternation of all the words instead of
+    once per word. No word ends with the beginning of another, so occurrences
+    cannot overlap and every word present in the text is matched.
+    
+    Args:
+        pattern: Alternation of the escaped words
+        words: Words in order of preference
+        text: Text to search
+        
+    Returns:
+        The first listed word that occurs in the text, or None
+    """
+    found = {match.group() for match in pattern.finditer(text)}
+    if not found:
+        return None
+    return next(word for word in words if word in found)
+
+def _classify(pattern: re.Pattern, priority: Tuple[str, ...], text: str, default: str) -> str:
+    """
+    Classify text by the highest-priority named group of a pattern that matches it.
+    
+    The text is scanned once. Since a later group can match before an earlier
+    one, every match is collected and the first group in priority order wins,
+    as if each group had been searched for separately in that order.
+    
+    Args:
+        pattern: Compiled pattern with one named group per class
+        priority: Group names, highest priority first
+        text: Text to classify
+        default: Class to return when nothing matches
+        
+    Returns:
+        Name of the winning group, or the default
+    """
+    found = set()
+    for match in pattern.finditer(text):
+        if match.lastgroup == priority[0]:
+            return priority[0]
+        found.add(match.lastgroup)
+    return next((name for name in priority if name in found), default)
+
 class SchachinterScraper:
     """
     Service class for scraping the Schachinter.net website.
-    This is a simplified version that uses requests and BeautifulSoup directly.
+    This is a simplified version that uses aiohttp and BeautifulSoup directly.
     """
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the scraper with configuration from environment variables.
+        
+        Args:
+            session: Shared aiohttp session to fetch pages with. When not set,
+                the scraper opens its own session on the first fetch and keeps
+                it until close() is called.
         """
-        self.base_url = os.getenv("TARGET_URL", "https://www.schachinter.net/")
-        self.user_agent = os.getenv("USER_AGENT", "Mozilla/5.0")
+        settings = get_settings()
+        self.base_url = settings.target_url
+        self.user_agent = settings.user_agent
         
         # Set up headers for requests
         self.headers = {
             "User-Agent": self.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
         }
         
-        logger.info("Initialized simple scraper with requests and BeautifulSoup")
+        self.session = session
+        
+        # Session opened by the scraper itself, which close() is responsible for
+        self._own_session: Optional[aiohttp.ClientSession] = None
+        
+        # Validators of the last page parsed successfully and the tournaments found
+        # on it, so an unchanged page can be answered without parsing it again
+        self._last_etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._last_tournaments: Optional[List[Tournament]] = None
+        
+        logger.info("Initialized simple scraper with aiohttp and BeautifulSoup")
     
     async def fetch_page(self) -> Optional[Dict[str, Any]]:
         """
-        Fetch HTML content from Schachinter.net using requests.
+        Fetch HTML content from Schachinter.net using aiohttp.
+        
+        The request is conditional on the validators of the last parsed page,
+        so an unchanged page comes back as {"status": "unchanged"} without a body.
         
         Returns:
             Dictionary with page content or None if request failed
         """
         try:
-            logger.info(f"Fetching {self.base_url} using requests")
+            logger.info("Fetching %s using aiohttp", self.base_url)
             
-            # Make the request
-            response = requests.get(self.base_url, headers=self.headers, timeout=30)
-            response.raise_for_status()
+            # Make the request on the shared session, reusing its pooled connections
+            response = await self._get(self._ensure_session())
+            if response is None:
+                logger.info("%s not modified since the last crawl", self.base_url)
+                return {"status": "unchanged"}
+            html_content, etag, last_modified = response
             
-            html_content = response.text
-            logger.info(f"Successfully fetched {self.base_url}, content length: {len(html_content)}")
+            logger.info("Successfully fetched %s, content length: %d", self.base_url, len(html_content))
             
-            # Extract links
-            soup = BeautifulSoup(html_content, 'lxml')
-            links = [a.get('href') for a in soup.find_all('a', href=True)]
+            # Parse the page once in a worker thread, keeping the event loop free; parse_tournaments reuses the soup
+            page = await asyncio.get_running_loop().run_in_executor(None, self._build_page, html_content)
             
-            # Return in a format similar to what we'd expect from crawl4ai
+            # Return in a format similar to what we'd expect from crawl4ai, plus the pages keyed by URL
             return {
                 "status": "completed",
-                "pages": [{
-                    "url": self.base_url,
-                    "html": html_content,
-                    "text": soup.get_text(),
-                    "links": links
-                }]
+                "pages": [page],
+                "pages_by_url": {self.base_url: page},
+                "etag": etag,
+                "last_modified": last_modified
             }
             
-        except requests.RequestException as e:
-            logger.error(f"Error fetching {self.base_url}: {str(e)}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Error fetching %s: %s", self.base_url, e)
             return None
     
+    def _build_page(self, html_content: str) -> Dict[str, Any]:
+        """
+        Parse a fetched page and collect its links.
+        
+        Args:
+            html_content: Page HTML
+            
+        Returns:
+            Page dictionary with the URL, HTML, parsed soup and links
+        """
+        soup = BeautifulSoup(html_content, 'lxml')
+        links = [a.get('href') for a in soup.find_all('a', href=True)]
+        
+        return {
+            "url": self.base_url,
+            "html": html_content,
+            "soup": soup,
+            "links": links
+        }
+    
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Get the session to fetch with, opening the scraper's own one on first use.
+        
+        The scraper's session keeps connections alive and caches DNS lookups,
+        so repeated fetches skip the TCP/TLS handshakes. Request headers are
+        sent from self.headers on every request rather than stored on the
+        session, so changes to self.headers apply to passed-in sessions too.
+        
+        Returns:
+            The aiohttp session
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=SCRAPER_CONNECTION_LIMIT,
+                limit_per_host=SCRAPER_CONNECTIONS_PER_HOST,
+                keepalive_timeout=30,
+                ttl_dns_cache=300
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+            self._own_session = self.session
+        return self.session
+    
+    async def close(self):
+        """
+        Close the session the scraper opened itself; a session passed in is left to its owner.
+        """
+        if self._own_session is not None:
+            await self._own_session.close()
+            if self.session is self._own_session:
+                self.session = None
+            self._own_session = None
+    
+    async def _get(self, session: aiohttp.ClientSession) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        """
+        Download the target page unless it is unchanged since the last parse.
+        
+        Args:
+            session: aiohttp session to send the request with
+            
+        Returns:
+            Tuple of page HTML, ETag and Last-Modified header, or None if the server answered 304
+        """
+        headers = self.headers
+        if self._last_tournaments is not None and (self._last_etag or self._last_modified):
+            # Ask the server to skip the body if the page has not changed
+            headers = dict(headers)
+            if self._last_etag:
+                headers["If-None-Match"] = self._last_etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        
+        async with session.get(self.base_url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status == 304:
+                return None
+            response.raise_for_status()
+            html_content = await response.text()
+            return html_content, response.headers.get("ETag"), response.headers.get("Last-Modified")
+    
     async def parse_tournaments(self, crawl_result: Dict[str, Any]) -> List[Tournament]:
         """
         Parse the page content to extract tournament information.
         
+        The parsing is CPU-bound, so it runs in a worker thread rather than
+        on the event loop, which may also be serving API requests.
+        
+        Args:
+            crawl_result: Dictionary containing page content
+            
+        Returns:
+            List of Tournament objects
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self._parse_tournaments_sync, crawl_result)
+    
+    def _parse_tournaments_sync(self, crawl_result: Dict[str, Any]) -> List[Tournament]:
+        """
+        Parse the page content to extract tournament information, blocking until done.
+        
         Args:
             crawl_result: Dictionary containing page content
             
@@ -90,8 +347,12 @@ class SchachinterScraper:
         
         tournaments = []
         
-        # Get the main page content
-        main_page = next((page for page in crawl_result["pages"] if page["url"] == self.base_url), None)
+        # Get the main page content, scanning the page list for results without the URL index
+        pages_by_url = crawl_result.get("pages_by_url")
+        if pages_by_url is not None:
+            main_page = pages_by_url.get(self.base_url)
+        else:
+            main_page = next((page for page in crawl_result["pages"] if page["url"] == self.base_url), None)
         if not main_page:
             logger.error("Main page not found in crawl result")
             return []
@@ -101,14 +362,16 @@ class SchachinterScraper:
             logger.error("No HTML content found in crawl result")
             return []
         
-        # Parse the HTML with BeautifulSoup
-        soup = BeautifulSoup(html_content, 'lxml')
+        # Reuse the soup parsed by fetch_page, parsing the HTML only if there is none
+        soup = main_page.get("soup")
+        if soup is None:
+            soup = BeautifulSoup(html_content, 'lxml')
         
         # Extract the current year from the website
         current_year = datetime.now().year
         
         # Try to find year information on the page
-        year_match = re.search(r'(\d{4})', html_content)
+        year_match = YEAR_PATTERN.search(html_content)
         if year_match:
             current_year = int(year_match.group(1))
         
@@ -120,27 +383,23 @@ class SchachinterScraper:
             tournament_names = self._extract_tournament_names(month_content)
             
             for tournament_name in tournament_names:
-                # Create tournament object
-                tournament = Tournament(
+                # If it's international, try to extract the country; default to Germany otherwise
+                is_international = self._determine_if_international(tournament_name)
+                country = self._extract_country(tournament_name) if is_international else "Germany"
+                
+                # Create tournament object with every field decided up front
+                tournaments.append(Tournament(
                     name=tournament_name,
                     month=month_name,
                     year=current_year,
-                    is_international=self._determine_if_international(tournament_name),
+                    is_international=is_international,
                     city=self._extract_city(tournament_name),
-                    country="Germany",  # Default, will be overridden if international
+                    country=country,
                     tournament_type=self._determine_tournament_type(tournament_name),
                     category=self._determine_category(tournament_name, month_content)
-                )
-                
-                # If it's international, try to extract the country
-                if tournament.is_international:
-                    country = self._extract_country(tournament_name)
-                    if country:
-                        tournament.country = country
-                
-                tournaments.append(tournament)
+                ))
         
-        logger.info(f"Extracted {len(tournaments)} tournaments")
+        logger.info("Extracted %d tournaments", len(tournaments))
         return tournaments
     
     def _extract_month_blocks(self, soup: BeautifulSoup) -> Dict[str, BeautifulSoup]:
@@ -155,26 +414,26 @@ class SchachinterScraper:
         """
         month_blocks = {}
         
-        # Look for month indicators - this is site-specific and needs analysis
-        # Common German month names
-        german_months = ["Januar", "Februar", "März", "April", "Mai", "Juni", 
-                        "Juli", "August", "September", "Oktober", "November", "Dezember"]
-        
-        # Also look for abbreviated months
-        english_months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", 
-                         "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-        
-        # Find month sections based on text content
-        for month in german_months + english_months:
-            month_elements = soup.find_all(string=lambda text: text and month in text)
-            for element in month_elements:
-                parent = element.parent
-                # Try to get the nearest content section
-                section = self._find_section_for_month(parent, month)
-                if section:
-                    # Standardize month name to English
-                    std_month = self._standardize_month_name(month)
-                    month_blocks[std_month] = section
+        # Walk the page once, noting every month name each text node mentions.
+        # Names can overlap ("Januar" contains "Jan"), so they are checked one
+        # by one, but only in text nodes the combined pattern already matched
+        mentions = []
+        for element in soup.find_all(string=lambda text: text and MONTH_NAMES_PATTERN.search(text)):
+            for index, month in enumerate(MONTH_NAMES):
+                if month in element:
+                    mentions.append((index, element))
+        
+        # Assign sections month name by month name, in page order within each,
+        # so later mentions replace earlier ones as with one search per name
+        mentions.sort(key=itemgetter(0))
+        for index, element in mentions:
+            month = MONTH_NAMES[index]
+            # Try to get the nearest content section
+            section = self._find_section_for_month(element.parent, month)
+            if section:
+                # Standardize month name to English
+                std_month = self._standardize_month_name(month)
+                month_blocks[std_month] = section
         
         return month_blocks
     
@@ -189,18 +448,18 @@ class SchachinterScraper:
         Returns:
             BeautifulSoup object representing the section, or None
         """
-        # Try to find a parent div or section that contains this month
-        current = element
-        for _ in range(3):  # Look up to 3 levels up
-            if current and current.find_all(text=True, recursive=True):
+        # Try to find a parent div or section that contains this month,
+        # stopping at the first string (comments and whitespace included)
+        # instead of collecting the whole subtree
+        for current in islice(chain((element,), element.parents), 3):  # Look up to 3 levels up
+            if current.find(string=True) is not None:
                 return current
-            if current:
-                current = current.parent
         
         # If no clear section found, return the original element
         return element
     
-    def _standardize_month_name(self, month: str) -> str:
+    @staticmethod
+    def _standardize_month_name(month: str) -> str:
         """
         Convert German or abbreviated month names to standard English names.
         
@@ -210,34 +469,7 @@ class SchachinterScraper:
         Returns:
             Standardized month name in English
         """
-        month_mapping = {
-            "Januar": "January",
-            "Februar": "February", 
-            "März": "March",
-            "April": "April",
-            "Mai": "May",
-            "Juni": "June",
-            "Juli": "July",
-            "August": "August",
-            "September": "September",
-            "Oktober": "October",
-            "November": "November",
-            "Dezember": "December",
-            "Jan": "January",
-            "Feb": "February",
-            "Mar": "March",
-            "Apr": "April",
-            "May": "May",
-            "Jun": "June",
-            "Jul": "July",
-            "Aug": "August",
-            "Sep": "September",
-            "Oct": "October",
-            "Nov": "November",
-            "Dec": "December"
-        }
-        
-        return month_mapping.get(month, month)
+        return MONTH_NAME_MAPPING.get(month, month)
     
     def _extract_tournament_names(self, section: BeautifulSoup) -> List[str]:
         """
@@ -250,31 +482,31 @@ class SchachinterScraper:
             List of tournament names
         """
         tournament_names = []
-        
-        # Look for typical tournament name patterns
-        # Names are likely to be in links, strong/b tags, or headings
-        for element in section.find_all(['a', 'strong', 'b', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            text = element.get_text(strip=True)
-            if text and len(text) > 3 and text not in ["Jan", "Feb", "Mar", "Apr", "May", "Jun", 
-                                                      "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]:
-                # Filter out month names themselves
-                if not any(month in text for month in ["Januar", "Februar", "März", "April", "Mai", "Juni", 
-                                                     "Juli", "August", "September", "Oktober", "November", "Dezember"]):
-                    tournament_names.append(text)
-        
-        # Also look for text that might be tournament names based on pattern
-        for element in section.find_all(text=True):
-            text = element.strip()
-            if text and len(text) > 10:  # Reasonably long text
-                # Look for typical tournament name patterns
-                if re.search(r'(Open|Championship|Tournament|Cup|Masters|Schach|Turnier)', text, re.IGNORECASE):
-                    tournament_names.append(text)
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        return [name for name in tournament_names if not (name in seen or seen.add(name))]
+        pattern_names = []
+        
+        # Walk the section once, checking both tags and text
+        for element in section.descendants:
+            if isinstance(element, NavigableString):
+                # Also look for text that might be tournament names based on pattern
+                text = element.strip()
+                if text and len(text) > 10:  # Reasonably long text
+                    # Look for typical tournament name patterns
+                    if TOURNAMENT_NAME_PATTERN.search(text):
+                        pattern_names.append(text)
+            elif element.name in NAME_TAGS:
+                # Names are likely to be in links, strong/b tags, or headings
+                text = element.get_text(strip=True)
+                if text and len(text) > 3 and text not in MONTH_ABBREVIATION_SET:
+                    # Filter out month names themselves
+                    if not GERMAN_MONTH_NAMES_PATTERN.search(text):
+                        tournament_names.append(text)
+        
+        # Remove duplicates while preserving order, listing tag names before pattern matches
+        return list(dict.fromkeys(tournament_names + pattern_names))
     
-    def _determine_if_international(self, tournament_name: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)
+    def _determine_if_international(tournament_name: str) -> bool:
         """
         Determine if a tournament is international based on its name.
         
@@ -284,14 +516,11 @@ class SchachinterScraper:
         Returns:
             True if the tournament appears to be international, False otherwise
         """
-        international_keywords = [
-            "International", "World", "European", "Europe", "FIDE", 
-            "International", "Weltmeisterschaft", "Europameisterschaft"
-        ]
-        
-        return any(keyword.lower() in tournament_name.lower() for keyword in international_keywords)
+        return INTERNATIONAL_PATTERN.search(tournament_name.lower()) is not None
     
-    def _extract_city(self, tournament_name: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)
+    def _extract_city(tournament_name: str) -> Optional[str]:
         """
         Extract the city from the tournament name if possible.
         
@@ -301,27 +530,21 @@ class SchachinterScraper:
         Returns:
             City name or None if not found
         """
-        # List of common German cities
-        common_cities = [
-            "Berlin", "Hamburg", "München", "Köln", "Frankfurt", "Stuttgart", 
-            "Düsseldorf", "Leipzig", "Dortmund", "Essen", "Dresden", "Bremen",
-            "Hannover", "Nürnberg", "Duisburg", "Bochum", "Wuppertal", "Bonn",
-            "Mannheim", "Karlsruhe", "Münster", "Wiesbaden", "Augsburg"
-        ]
-        
         # Check if any of the common cities are in the tournament name
-        for city in common_cities:
-            if city in tournament_name:
-                return city
+        city = _first_listed(COMMON_CITIES_PATTERN, COMMON_CITIES, tournament_name)
+        if city:
+            return city
         
         # Try to extract with regex patterns common for tournament naming
-        city_match = re.search(r'in\s+([A-Z][a-zäöüß]+(?:\s+[A-Z][a-zäöüß]+)?)', tournament_name)
+        city_match = CITY_PATTERN.search(tournament_name)
         if city_match:
             return city_match.group(1)
         
         return None
     
-    def _extract_country(self, tournament_name: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)
+    def _extract_country(tournament_name: str) -> Optional[str]:
         """
         Extract the country from the tournament name for international tournaments.
         
@@ -331,23 +554,13 @@ class SchachinterScraper:
         Returns:
             Country name or None if not found
         """
-        # List of common European countries
-        common_countries = [
-            "Germany", "France", "Spain", "Italy", "Netherlands", "Belgium",
-            "Austria", "Switzerland", "Denmark", "Sweden", "Norway", "Finland",
-            "Poland", "Czech Republic", "Hungary", "Romania", "Bulgaria",
-            "Greece", "Portugal", "Ireland", "UK", "United Kingdom"
-        ]
-        
-        # Check if any of the common countries are in the tournament name
-        for country in common_countries:
-            if country in tournament_name:
-                return country
-        
-        # Default to Germany for most tournaments
-        return "Germany"
+        # Check if any of the common countries are in the tournament name,
+        # defaulting to Germany for most tournaments
+        return _first_listed(COMMON_COUNTRIES_PATTERN, COMMON_COUNTRIES, tournament_name) or "Germany"
     
-    def _determine_tournament_type(self, tournament_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)
+    def _determine_tournament_type(tournament_name: str) -> str:
         """
         Determine the type of tournament based on its name.
         
@@ -357,14 +570,8 @@ class SchachinterScraper:
         Returns:
             Tournament type (Standard, Rapid, Blitz, etc.)
         """
-        if re.search(r'(Rapid|Schnell)', tournament_name, re.IGNORECASE):
-            return "Rapid"
-        elif re.search(r'Blitz', tournament_name, re.IGNORECASE):
-            return "Blitz"
-        elif re.search(r'(Online|Internet)', tournament_name, re.IGNORECASE):
-            return "Online"
-        else:
-            return "Standard"  # Default to standard
+        # Default to standard
+        return _classify(TOURNAMENT_TYPE_PATTERN, TOURNAMENT_TYPE_PRIORITY, tournament_name, "Standard")
     
     def _determine_category(self, tournament_name: str, section: BeautifulSoup) -> str:
         """
@@ -377,17 +584,22 @@ class SchachinterScraper:
         Returns:
             Tournament category (Open, Youth, Women, etc.)
         """
-        name_lower = tournament_name.lower()
-        if re.search(r'(junior|jugend|youth|u\d+)', name_lower):
-            return "Youth"
-        elif re.search(r'(women|frauen|damen)', name_lower):
-            return "Women"
-        elif re.search(r'(senior|senioren)', name_lower):
-            return "Senior"
-        elif re.search(r'(team|mannschaft|verein)', name_lower):
-            return "Team"
-        else:
-            return "Open"  # Default to open
+        return self._category_from_name(tournament_name)
+    
+    @staticmethod
+    @lru_cache(maxsize=CLASSIFIER_CACHE_SIZE)
+    def _category_from_name(tournament_name: str) -> str:
+        """
+        Determine the category of the tournament from its name alone.
+        
+        Args:
+            tournament_name: Name of the tournament
+            
+        Returns:
+            Tournament category (Open, Youth, Women, etc.)
+        """
+        # Default to open
+        return _classify(CATEGORY_PATTERN, CATEGORY_PRIORITY, tournament_name.lower(), "Open")
     
     async def scrape(self) -> List[Tournament]:
         """
@@ -396,7 +608,7 @@ class SchachinterScraper:
         Returns:
             List of Tournament objects
         """
-        logger.info(f"Starting to scrape {self.base_url}")
+        logger.info("Starting to scrape %s", self.base_url)
         
         # Step 1: Fetch the page
         crawl_result = await self.fetch_page()
@@ -404,8 +616,18 @@ class SchachinterScraper:
             logger.error("Failed to fetch the main page")
             return []
         
+        # An unchanged page holds the same tournaments as last time
+        if crawl_result["status"] == "unchanged" and self._last_tournaments is not None:
+            logger.info("Scraping skipped, reusing %d tournaments from the unchanged page", len(self._last_tournaments))
+            return list(self._last_tournaments)
+        
         # Step 2: Parse the results
         tournaments = await self.parse_tournaments(crawl_result)
-        logger.info(f"Scraping completed, found {len(tournaments)} tournaments")
+        logger.info("Scraping completed, found %d tournaments", len(tournaments))
+        
+        # Remember the page's validators only once it has been parsed
+        self._last_etag = crawl_result.get("etag")
+        self._last_modified = crawl_result.get("last_modified")
+        self._last_tournaments = tournaments
         
-        return tournaments 
\ No newline at end of file
+        return list(tournaments) 
\ No newline at end of file
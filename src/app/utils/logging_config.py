@@ -1,27 +1,42 @@
 import logging
-import os
 import sys
-from dotenv import load_dotenv
+from logging.handlers import RotatingFileHandler
 
-# Load environment variables
-load_dotenv()
+from ..config import get_settings
+
+# Log file written next to the working directory, rotated once it reaches 10 MB
+LOG_FILE = "chess_crawler.log"
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 3
 
 def setup_logging():
     """
     Configure logging for the application.
     
-    Uses LOG_LEVEL from environment variables, defaults to DEBUG.
+    Uses LOG_LEVEL from environment variables, defaults to DEBUG. Only the
+    first call configures the root logger, so entry points and scripts that
+    import each other do not attach duplicate handlers.
     """
-    log_level_name = os.getenv("LOG_LEVEL", "DEBUG").upper()
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+    
+    log_level_name = get_settings().log_level.upper()
     log_level = getattr(logging, log_level_name, logging.DEBUG)
     
-    # Configure root logger
+    # Configure root logger; the log file is only opened when the first record is written
     logging.basicConfig(
         level=log_level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler("chess_crawler.log")
+            RotatingFileHandler(
+                LOG_FILE,
+                maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=LOG_FILE_BACKUP_COUNT,
+                encoding="utf-8",
+                delay=True
+            )
         ]
     )
     
@@ -35,4 +50,4 @@ def setup_logging():
     logging.getLogger("app").setLevel(logging.DEBUG)
     
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured with level: {log_level_name}") 
\ No newline at end of file
+    logger.info("Logging configured with level: %s", log_level_name)
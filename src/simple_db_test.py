@@ -50,30 +50,19 @@ def test_supabase_operations():
         }
         print(f"Created test data: {json.dumps(test_tournament)}")
         
-        # Check if the tournament exists
-        print("Checking if tournament exists...")
+        # Insert the tournament unless it exists, in one request; relies on the
+        # unique (name, month, year) key from supabase/migrations/0002_tournament_unique_key.sql
+        print("Inserting tournament if it does not exist...")
         try:
-            response = supabase.table(table_name).select("*") \
-                .eq('name', test_tournament["name"]) \
-                .eq('month', test_tournament["month"]) \
-                .eq('year', test_tournament["year"]) \
+            insert_response = supabase.table(table_name) \
+                .upsert(test_tournament, on_conflict='name,month,year', ignore_duplicates=True) \
                 .execute()
+            print(f"Insert response: {insert_response}")
             
-            exists = response.data and len(response.data) > 0
-            print(f"Tournament exists check: {exists}")
-            
-            if exists:
-                print("Tournament already exists, not inserting again")
+            if insert_response.data:
+                print(f"Tournament inserted with ID: {insert_response.data[0].get('id')}")
             else:
-                # Insert the tournament
-                print("Inserting tournament...")
-                insert_response = supabase.table(table_name).insert(test_tournament).execute()
-                print(f"Insert response: {insert_response}")
-                
-                if insert_response.data:
-                    print(f"Tournament inserted with ID: {insert_response.data[0].get('id')}")
-                else:
-                    print("No data returned from insert operation")
+                print("Tournament already exists, not inserting again")
         except Exception as e:
             print(f"Error checking/inserting tournament: {str(e)}")
         
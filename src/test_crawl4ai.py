@@ -4,8 +4,9 @@ Test script for crawl4ai functionality.
 """
 import crawl4ai
 import asyncio
+import aiohttp
 import logging
-import inspect
+import time
 
 # Configure logging
 logging.basicConfig(
@@ -37,18 +38,20 @@ async def test_crawl4ai():
                     verbose=True
                 )
                 
-                logger.info(f"Crawl completed successfully")
-                logger.info(f"URL: {result.url}")
-                logger.info(f"Title: {result.title}")
-                logger.info(f"Text length: {len(result.text or '')}")
-                logger.info(f"HTML length: {len(result.html or '')}")
+                logger.info("Crawl completed successfully")
+                logger.info("URL: %s", result.url)
+                logger.info("Title: %s", result.title)
+                text = result.text or ''
+                html = result.html or ''
+                logger.info("Text length: %d", len(text))
+                logger.info("HTML length: %d", len(html))
                 
                 # Try to extract some content
-                if result.text:
-                    logger.info(f"First 100 chars of text: {result.text[:100]}...")
+                if text:
+                    logger.info("First 100 chars of text: %s...", text[:100])
                 
             except Exception as e:
-                logger.error(f"Error using arun method: {str(e)}")
+                logger.error("Error using arun method: %s", e)
                 
                 # Try to use the start method to start the server
                 logger.info("Trying to start the server...")
@@ -60,41 +63,54 @@ async def test_crawl4ai():
                     # Wait a bit for the server to initialize
                     await asyncio.sleep(2)
                     
-                    # Now try to use the REST API
-                    import requests
-                    response = requests.post(
-                        "http://localhost:11235/crawl",
-                        json={
-                            "urls": "https://www.example.com",
-                            "extract_text": True,
-                            "extract_html": True
-                        }
-                    )
-                    
-                    if response.status_code == 200:
-                        task_id = response.json().get("task_id")
-                        logger.info(f"Crawl job submitted, task_id: {task_id}")
+                    # Now try to use the REST API, sending the job and every poll over one
+                    # aiohttp session so the requests do not block the event loop
+                    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+                        async with session.post(
+                            "http://localhost:11235/crawl",
+                            json={
+                                "urls": "https://www.example.com",
+                                "extract_text": True,
+                                "extract_html": True
+                            }
+                        ) as response:
+                            # Keep the error body for failed requests, to log with the status
+                            submit_status = response.status
+                            submit_body = await response.json() if submit_status == 200 else await response.text()
                         
-                        # Poll for results
-                        for _ in range(10):  # Try for up to 10 times
-                            await asyncio.sleep(1)
-                            result_response = requests.get(f"http://localhost:11235/task/{task_id}")
-                            if result_response.status_code == 200:
-                                result = result_response.json()
-                                if result.get("status") == "completed":
-                                    logger.info(f"Crawl completed: {result}")
-                                    break
-                                elif result.get("status") == "failed":
-                                    logger.error(f"Crawl failed: {result}")
-                                    break
+                        if submit_status == 200:
+                            task_id = submit_body.get("task_id")
+                            logger.info("Crawl job submitted, task_id: %s", task_id)
+                            
+                            # Poll for results, backing off from 50 ms to 2 s between polls for up to 30 s
+                            delay = 0.05
+                            deadline = time.monotonic() + 30
+                            while time.monotonic() < deadline:
+                                await asyncio.sleep(delay)
+                                delay = min(delay * 2, 2.0)
+                                # Keep a slow poll from running past the deadline
+                                remaining = max(deadline - time.monotonic(), 0.1)
+                                async with session.get(
+                                    f"http://localhost:11235/task/{task_id}",
+                                    timeout=aiohttp.ClientTimeout(total=remaining)
+                                ) as result_response:
+                                    status_code = result_response.status
+                                    result = await result_response.json() if status_code == 200 else await result_response.text()
+                                if status_code == 200:
+                                    if result.get("status") == "completed":
+                                        logger.info("Crawl completed: %s", result)
+                                        break
+                                    elif result.get("status") == "failed":
+                                        logger.error("Crawl failed: %s", result)
+                                        break
+                                    else:
+                                        logger.info("Crawl in progress: %s", result.get('status'))
                                 else:
-                                    logger.info(f"Crawl in progress: {result.get('status')}")
-                            else:
-                                logger.error(f"Failed to get task status: {result_response.status_code}")
-                    else:
-                        logger.error(f"Failed to submit crawl job: {response.status_code}")
-                except Exception as e:
-                    logger.error(f"Error starting server or using REST API: {str(e)}")
+                                    logger.error("Failed to get task status: %s %s", status_code, result[:200])
+                        else:
+                            logger.error("Failed to submit crawl job: %s %s", submit_status, submit_body[:200])
+                except Exception as rest_error:
+                    logger.error("Error starting server or using REST API: %s", rest_error)
         else:
             logger.info("Using WebCrawler")
             crawler = crawl4ai.WebCrawler()
@@ -109,21 +125,28 @@ async def test_crawl4ai():
                     verbose=True
                 )
                 
-                logger.info(f"Crawl completed successfully")
-                logger.info(f"URL: {result.url}")
-                logger.info(f"Title: {result.title}")
-                logger.info(f"Text length: {len(result.text or '')}")
-                logger.info(f"HTML length: {len(result.html or '')}")
+                logger.info("Crawl completed successfully")
+                logger.info("URL: %s", result.url)
+                logger.info("Title: %s", result.title)
+                logger.info("Text length: %d", len(result.text or ''))
+                logger.info("HTML length: %d", len(result.html or ''))
             except Exception as e:
-                logger.error(f"Error using run method: {str(e)}")
+                logger.error("Error using run method: %s", e)
         
         logger.info("Crawl4ai test completed")
         
     except Exception as e:
-        logger.error(f"Error testing crawl4ai: {str(e)}")
+        logger.error("Error testing crawl4ai: %s", e)
         raise
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     try:
         asyncio.run(test_crawl4ai())
     except KeyboardInterrupt:
@@ -4,19 +4,41 @@ Simple test script for Supabase connection.
 """
 
 import os
+from typing import Optional
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
 # Load environment variables
 load_dotenv()
 
+# Client created by the first connection test, reused by later calls
+_SUPABASE: Optional[Client] = None
+
+def _get_client(supabase_url: str, supabase_key: str) -> Client:
+    """
+    Get the module's Supabase client, creating it on first use.
+    
+    Args:
+        supabase_url: Supabase project URL
+        supabase_key: API key to connect with
+        
+    Returns:
+        Shared Supabase client
+    """
+    global _SUPABASE
+    if _SUPABASE is None:
+        _SUPABASE = create_client(supabase_url, supabase_key)
+    return _SUPABASE
+
 def test_supabase_connection():
     """Test basic Supabase connection."""
     print("Testing Supabase connection...")
     
     supabase_url = os.getenv("SUPABASE_URL")
-    # Use service role key for admin access
-    supabase_key = os.getenv("SUPABASE_SERVICE_ROLE", os.getenv("SUPABASE_KEY"))
+    # Use service role key for admin access, reading each variable once
+    service_role = os.getenv("SUPABASE_SERVICE_ROLE")
+    supabase_key = service_role if service_role is not None else os.getenv("SUPABASE_KEY")
+    using_service_role = service_role is not None
     
     if not supabase_url or not supabase_key:
         print("ERROR: SUPABASE_URL and SUPABASE_KEY/SUPABASE_SERVICE_ROLE must be set in environment variables")
@@ -30,10 +52,10 @@ def test_supabase_connection():
         print("Creating client with parameters:")
         print(f"- URL: {supabase_url}")
         print(f"- Key: {supabase_key[:5]}...{supabase_key[-5:]}")
-        print(f"- Using service role key: {os.getenv('SUPABASE_SERVICE_ROLE') == supabase_key}")
+        print(f"- Using service role key: {using_service_role}")
         
-        # Create client
-        supabase = create_client(supabase_url, supabase_key)
+        # Create client, or reuse the one from an earlier call
+        supabase = _get_client(supabase_url, supabase_key)
         
         # Test a simple query to verify connection
         print("Testing query...")
@@ -43,9 +65,11 @@ def test_supabase_connection():
         print(f"Using table name: {table_name}")
         
         try:
-            # Try a simple query first to check if table exists
-            response = supabase.table(table_name).select("*").limit(1).execute()
+            # Try a simple query first to check if table exists, counting rows
+            # with a HEAD request so no row body is sent back
+            response = supabase.table(table_name).select("id", count="exact", head=True).execute()
             print(f"Query response: {response}")
+            print(f"Row count: {response.count}")
             print(f"Table {table_name} exists.")
             print("Connection successful!")
         except Exception as e:
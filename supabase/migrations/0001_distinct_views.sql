@@ -0,0 +1,37 @@
+-- Distinct-value views backing the enumeration endpoints
+-- (/api/months, /api/years, /api/categories, /api/tournament-types).
+--
+-- Each view is read by SupabaseClient.get_distinct(column) as
+-- "<SUPABASE_TABLE_PREFIX>distinct_<column>". GROUP BY is used instead of
+-- DISTINCT so Postgres can plan a (parallel) hash aggregate.
+--
+-- Table names assume the default "ct_" prefix; adjust if SUPABASE_TABLE_PREFIX
+-- is set to something else.
+
+CREATE OR REPLACE VIEW ct_distinct_month AS
+SELECT month
+FROM ct_tournaments
+WHERE month IS NOT NULL
+GROUP BY month
+ORDER BY month;
+
+CREATE OR REPLACE VIEW ct_distinct_year AS
+SELECT year
+FROM ct_tournaments
+WHERE year IS NOT NULL
+GROUP BY year
+ORDER BY year;
+
+CREATE OR REPLACE VIEW ct_distinct_category AS
+SELECT category
+FROM ct_tournaments
+WHERE category IS NOT NULL
+GROUP BY category
+ORDER BY category;
+
+CREATE OR REPLACE VIEW ct_distinct_tournament_type AS
+SELECT tournament_type
+FROM ct_tournaments
+WHERE tournament_type IS NOT NULL
+GROUP BY tournament_type
+ORDER BY tournament_type;
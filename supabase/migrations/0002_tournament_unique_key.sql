@@ -0,0 +1,10 @@
+-- A tournament is identified by its name, month and year. The unique
+-- constraint lets SupabaseClient.upsert_tournaments insert a whole batch with
+-- INSERT ... ON CONFLICT (name, month, year) DO NOTHING.
+--
+-- Remove any existing duplicates before applying, e.g.:
+--   DELETE FROM ct_tournaments a USING ct_tournaments b
+--   WHERE a.ctid > b.ctid AND a.name = b.name AND a.month = b.month AND a.year = b.year;
+
+ALTER TABLE ct_tournaments
+    ADD CONSTRAINT ct_tournaments_name_month_year_key UNIQUE (name, month, year);
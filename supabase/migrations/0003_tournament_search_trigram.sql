@@ -0,0 +1,17 @@
+-- Trigram indexes for the search filter of SupabaseClient.get_tournaments,
+-- which matches name, description and city with ILIKE '%term%'. A leading
+-- wildcard cannot use a B-tree index, so without these every search scans
+-- the whole table; pg_trgm GIN indexes serve ILIKE patterns directly and the
+-- query itself does not change. The OR of the three columns is answered with
+-- a BitmapOr over the three indexes.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ct_tournaments_name_trgm
+    ON ct_tournaments USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ct_tournaments_description_trgm
+    ON ct_tournaments USING gin (description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ct_tournaments_city_trgm
+    ON ct_tournaments USING gin (city gin_trgm_ops);
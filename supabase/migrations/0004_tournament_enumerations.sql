@@ -0,0 +1,39 @@
+-- Single-row materialized view with every distinct month, year, category and
+-- tournament type, so the enumeration endpoints (/api/enumerations and the
+-- legacy /api/months, /api/years, /api/categories, /api/tournament-types)
+-- are served from one round-trip.
+--
+-- Read by SupabaseClient.get_enumerations() as
+-- "<SUPABASE_TABLE_PREFIX>tournament_enumerations". Table names assume the
+-- default "ct_" prefix.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS ct_tournament_enumerations AS
+SELECT
+    1 AS id,
+    COALESCE(array_agg(DISTINCT month ORDER BY month) FILTER (WHERE month IS NOT NULL), '{}') AS months,
+    COALESCE(array_agg(DISTINCT year ORDER BY year) FILTER (WHERE year IS NOT NULL), '{}') AS years,
+    COALESCE(array_agg(DISTINCT category ORDER BY category) FILTER (WHERE category IS NOT NULL), '{}') AS categories,
+    COALESCE(array_agg(DISTINCT tournament_type ORDER BY tournament_type) FILTER (WHERE tournament_type IS NOT NULL), '{}') AS tournament_types
+FROM ct_tournaments;
+
+-- REFRESH ... CONCURRENTLY requires a unique index
+CREATE UNIQUE INDEX IF NOT EXISTS ct_tournament_enumerations_id_key
+    ON ct_tournament_enumerations (id);
+
+CREATE OR REPLACE FUNCTION ct_refresh_tournament_enumerations()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY ct_tournament_enumerations;
+    RETURN NULL;
+END;
+$$;
+
+-- Statement-level, so a bulk upsert refreshes the view once
+DROP TRIGGER IF EXISTS ct_tournaments_refresh_enumerations ON ct_tournaments;
+CREATE TRIGGER ct_tournaments_refresh_enumerations
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON ct_tournaments
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION ct_refresh_tournament_enumerations();
@@ -0,0 +1,35 @@
+-- Return months in calendar order instead of alphabetically, so callers can
+-- use the lists as-is. Unknown month names sort last rather than failing the
+-- view, since array_position() returns NULL for them.
+
+CREATE OR REPLACE VIEW ct_distinct_month AS
+SELECT month
+FROM ct_tournaments
+WHERE month IS NOT NULL
+GROUP BY month
+ORDER BY array_position(
+    ARRAY['January', 'February', 'March', 'April', 'May', 'June', 'July',
+          'August', 'September', 'October', 'November', 'December'],
+    month
+), month;
+
+DROP MATERIALIZED VIEW IF EXISTS ct_tournament_enumerations;
+
+CREATE MATERIALIZED VIEW ct_tournament_enumerations AS
+SELECT
+    1 AS id,
+    COALESCE((
+        SELECT array_agg(month ORDER BY array_position(
+            ARRAY['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                  'August', 'September', 'October', 'November', 'December'],
+            month
+        ), month)
+        FROM (SELECT DISTINCT month FROM ct_tournaments WHERE month IS NOT NULL) AS distinct_months
+    ), '{}') AS months,
+    COALESCE(array_agg(DISTINCT year ORDER BY year) FILTER (WHERE year IS NOT NULL), '{}') AS years,
+    COALESCE(array_agg(DISTINCT category ORDER BY category) FILTER (WHERE category IS NOT NULL), '{}') AS categories,
+    COALESCE(array_agg(DISTINCT tournament_type ORDER BY tournament_type) FILTER (WHERE tournament_type IS NOT NULL), '{}') AS tournament_types
+FROM ct_tournaments;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ct_tournament_enumerations_id_key
+    ON ct_tournament_enumerations (id);